@@ -0,0 +1,36 @@
+"""
+Shared OOXML toolkit used by the docx and pptx skills: pack, unpack and
+validate Office files.
+
+Public names are imported on first use, so ``from ooxml import pack_document``
+loads neither lxml nor the validators.
+"""
+
+import importlib
+
+# Public name -> module (relative to this package) that defines it
+_LAZY_ATTRIBUTES = {
+    "pack_document": ".pack",
+    "unpack_document": ".unpack",
+    "BaseSchemaValidator": ".validation",
+    "DOCXSchemaValidator": ".validation",
+    "OriginalPackage": ".validation",
+    "PPTXSchemaValidator": ".validation",
+    "RedliningValidator": ".validation",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,294 @@
+"""
+Condense and pretty-print XML parts of Office files.
+
+Two engines produce the same bytes:
+
+- "expat" (default) streams the part through expat and writes the result
+  directly, without building a DOM. It is many times faster than minidom and
+  needs a fraction of the memory on large parts such as document.xml or
+  sheetN.xml.
+- "minidom" parses the part with defusedxml.minidom and serializes the DOM.
+  It is the reference behavior and the fallback: the expat engine hands over
+  to it for anything it does not reproduce itself (DOCTYPEs, CDATA sections,
+  malformed input), so output and errors always match minidom's.
+"""
+
+from xml.dom import minidom
+from xml.parsers import expat
+
+import defusedxml.minidom
+
+ENGINES = ("expat", "minidom")
+DEFAULT_ENGINE = "expat"
+
+
+def condense_xml_bytes(data, engine=DEFAULT_ENGINE):
+    """Strip whitespace-only text and comments from an XML part.
+
+    Text in *:t elements (e.g. w:t, a:t) is kept as-is. The result is encoded
+    as UTF-8 with an XML declaration, as produced by minidom's toxml().
+
+    Args:
+        data: Raw bytes of the XML part
+        engine: One of ENGINES
+
+    Returns:
+        bytes: The condensed part
+    """
+    if engine == "expat":
+        try:
+            return _StreamingFormatter(condense=True).format(data)
+        except (_Unsupported, expat.ExpatError):
+            pass  # Let minidom produce the output or the error
+    elif engine != "minidom":
+        raise ValueError(f"Unknown XML engine {engine!r}, expected one of {ENGINES}")
+
+    dom = defusedxml.minidom.parseString(data)
+
+    # Process each element to remove whitespace and comments
+    for element in dom.getElementsByTagName("*"):
+        # Skip w:t elements and their processing
+        if element.tagName.endswith(":t"):
+            continue
+
+        # Remove whitespace-only text nodes and comment nodes
+        for child in list(element.childNodes):
+            if (
+                child.nodeType == child.TEXT_NODE
+                and child.nodeValue
+                and child.nodeValue.strip() == ""
+            ) or child.nodeType == child.COMMENT_NODE:
+                element.removeChild(child)
+
+    return dom.toxml(encoding="UTF-8")
+
+
+def pretty_xml_bytes(data, engine=DEFAULT_ENGINE):
+    """Pretty-print an XML part with two-space indentation.
+
+    The result is ASCII with character references for everything else, as
+    produced by minidom's toprettyxml(indent="  ", encoding="ascii").
+
+    Args:
+        data: Raw bytes of the XML part
+        engine: One of ENGINES
+
+    Returns:
+        bytes: The pretty-printed part
+    """
+    if engine == "expat":
+        try:
+            return _StreamingFormatter(indent="  ", newl="\n", encoding="ascii").format(
+                data
+            )
+        except (_Unsupported, expat.ExpatError):
+            pass  # Let minidom produce the output or the error
+    elif engine != "minidom":
+        raise ValueError(f"Unknown XML engine {engine!r}, expected one of {ENGINES}")
+
+    dom = defusedxml.minidom.parseString(data)
+    return dom.toprettyxml(indent="  ", encoding="ascii")
+
+
+class _Unsupported(Exception):
+    """Raised by the expat engine for input only minidom reproduces exactly."""
+
+
+def _minidom_escapes(attribute):
+    """Return the str.translate table minidom uses to escape text or attributes.
+
+    The table is taken from minidom itself, so the expat engine follows the
+    escaping of whichever Python version is running.
+    """
+    document = minidom.Document()
+    table = {}
+    for char in "&<>\"'\r\n\t":
+        if attribute:
+            element = document.createElement("a")
+            element.setAttribute("v", char)
+            escaped = element.toxml()[len('<a v="') : -len('"/>')]
+        else:
+            escaped = document.createTextNode(char).toxml()
+        if escaped != char:
+            table[ord(char)] = escaped
+    return table
+
+
+_TEXT_ESCAPES = _minidom_escapes(attribute=False)
+_ATTRIBUTE_ESCAPES = _minidom_escapes(attribute=True)
+
+
+class _OpenElement:
+    """Serialization state of an element whose end tag has not been seen yet."""
+
+    __slots__ = ("qname", "keep_whitespace", "child_count", "pending_text")
+
+    def __init__(self, qname, keep_whitespace):
+        self.qname = qname
+        self.keep_whitespace = keep_whitespace
+        self.child_count = 0
+        # A first text child is held back until it is known whether it is the
+        # only child, which minidom writes inline without indentation
+        self.pending_text = None
+
+
+class _StreamingFormatter:
+    """Serialize an XML part the way minidom would, straight from expat events.
+
+    With condense=True whitespace-only text and comments inside elements
+    other than *:t are dropped, as in condense_xml_bytes' minidom engine.
+    """
+
+    def __init__(self, indent="", newl="", encoding="UTF-8", condense=False):
+        self.indent = indent
+        self.newl = newl
+        self.encoding = encoding
+        self.condense = condense
+
+        self._out = []
+        self._stack = []
+        self._text = []
+        self._namespace_decls = []
+
+    def format(self, data):
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.namespace_prefixes = True
+        parser.buffer_text = True
+        parser.ordered_attributes = True
+        parser.specified_attributes = True
+
+        parser.StartDoctypeDeclHandler = self._unsupported
+        parser.StartCdataSectionHandler = self._unsupported
+        parser.StartNamespaceDeclHandler = self._start_namespace_decl
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._text.append
+        parser.CommentHandler = self._comment
+        parser.ProcessingInstructionHandler = self._processing_instruction
+
+        parser.Parse(data, True)
+
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>{self.newl}'
+        return (declaration + "".join(self._out)).encode(
+            self.encoding, "xmlcharrefreplace"
+        )
+
+    def _unsupported(self, *args):
+        raise _Unsupported()
+
+    def _start_namespace_decl(self, prefix, uri):
+        self._namespace_decls.append((prefix, uri))
+
+    def _start_element(self, name, attributes):
+        self._flush_text()
+        self._begin_node()
+
+        qname = self._qname(name)
+        out = [self.indent * len(self._stack), "<", qname]
+
+        # Like minidom, namespace declarations come before other attributes
+        for prefix, uri in self._namespace_decls:
+            out.append(f' xmlns:{prefix}="' if prefix else ' xmlns="')
+            out.append((uri or "").translate(_ATTRIBUTE_ESCAPES))
+            out.append('"')
+        self._namespace_decls.clear()
+
+        for i in range(0, len(attributes), 2):
+            out.append(f" {self._qname(attributes[i])}=\"")
+            out.append(attributes[i + 1].translate(_ATTRIBUTE_ESCAPES))
+            out.append('"')
+
+        self._out.append("".join(out))
+        self._stack.append(_OpenElement(qname, qname.endswith(":t")))
+
+    def _end_element(self, name):
+        self._flush_text()
+        element = self._stack.pop()
+
+        if element.child_count == 0:
+            self._out.append("/>" + self.newl)
+        elif element.pending_text is not None:
+            self._out.append(
+                ">"
+                + element.pending_text.translate(_TEXT_ESCAPES)
+                + f"</{element.qname}>{self.newl}"
+            )
+        else:
+            self._out.append(
+                f"{self.indent * len(self._stack)}</{element.qname}>{self.newl}"
+            )
+
+    def _comment(self, data):
+        self._flush_text()
+        if self.condense and self._stack and not self._stack[-1].keep_whitespace:
+            return
+        if "--" in data:
+            raise _Unsupported()  # minidom refuses to write it
+
+        self._begin_node()
+        self._out.append(f"{self.indent * len(self._stack)}<!--{data}-->{self.newl}")
+
+    def _processing_instruction(self, target, data):
+        self._flush_text()
+        self._begin_node()
+        self._out.append(
+            f"{self.indent * len(self._stack)}<?{target} {data}?>{self.newl}"
+        )
+
+    def _flush_text(self):
+        """Turn buffered character data into a text child of the open element."""
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text.clear()
+
+        element = self._stack[-1]
+        if self.condense and not element.keep_whitespace and data.strip() == "":
+            return
+
+        if element.child_count == 0:
+            element.child_count = 1
+            element.pending_text = data
+        else:
+            self._begin_node()
+            self._out.append(
+                (self.indent * len(self._stack) + data + self.newl).translate(
+                    _TEXT_ESCAPES
+                )
+            )
+
+    def _begin_node(self):
+        """Account for a new child of the open element before it is written."""
+        if not self._stack:
+            return
+        element = self._stack[-1]
+
+        if element.child_count == 0:
+            self._out.append(">" + self.newl)
+        elif element.pending_text is not None:
+            # The held-back text is not the only child after all
+            self._out.append(
+                ">"
+                + self.newl
+                + (
+                    self.indent * len(self._stack) + element.pending_text + self.newl
+                ).translate(_TEXT_ESCAPES)
+            )
+            element.pending_text = None
+        element.child_count += 1
+
+    @staticmethod
+    def _qname(name):
+        """Rebuild a prefixed name from expat's "uri local prefix" form."""
+        if " " not in name:
+            return name
+        parts = name.split(" ")
+        if len(parts) == 3:
+            return f"{parts[2]}:{parts[1]}"
+        if len(parts) == 2:
+            return parts[1]
+        raise _Unsupported()  # Spaces in namespace URIs
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,484 @@
+"""
+Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
+
+Parts that unpack.py --only left in the original file are copied from there.
+
+Example usage, through the launcher of the docx or pptx skill:
+    python ooxml/scripts/pack.py <input_directory> <office_file> [--force]
+        [--jobs N] [--deterministic] [--manifest <manifest.json>]
+
+or as a module from skills/_shared:
+    python -m ooxml.pack <input_directory> <office_file> ...
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .formatting import DEFAULT_ENGINE, condense_xml_bytes
+from .soffice import ConversionFailed, ListenerUnavailable, default_listener
+from .unpack import LAZY_SOURCE_FILE, read_lazy_parts
+
+# Media that is already compressed; deflating it again only costs CPU
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".wdp",
+    ".emz",
+    ".wmz",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".m4v",
+    ".docx",
+    ".pptx",
+    ".xlsx",
+    ".zip",
+}
+
+# Part every Office application expects first in the archive
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+# Timestamp of every entry in deterministic mode: the earliest a zip can hold
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Archive comment recording the content hash of a deterministic pack
+DIGEST_COMMENT_PREFIX = b"ooxml-pack sha256="
+
+# Bump whenever packing changes the bytes it writes for the same input, so
+# outputs of an older packer are never mistaken for up to date
+PACK_FORMAT_VERSION = 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
+    parser.add_argument("input_directory", help="Unpacked Office document directory")
+    parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for condensing XML parts (default: 1)",
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Write a reproducible archive (sorted entries, fixed timestamps) "
+        "and skip rewriting an output whose content hash is unchanged",
+    )
+    parser.add_argument(
+        "--manifest",
+        metavar="MANIFEST_FILE",
+        help="Also write the per-part content-hash manifest as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        success = pack_document(
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            jobs=args.jobs,
+            deterministic=args.deterministic,
+        )
+        if args.manifest:
+            manifest = pack_manifest(args.input_directory)
+            Path(args.manifest).write_text(json.dumps(manifest, indent=2) + "\n")
+
+        # Show warning if validation was skipped
+        if args.force:
+            print("Warning: Skipped validation, file may be corrupt", file=sys.stderr)
+        # Exit with error if validation failed
+        elif not success:
+            print("Contents would produce a corrupt file.", file=sys.stderr)
+            print("Please validate XML before repacking.", file=sys.stderr)
+            print("Use --force to skip validation and pack anyway.", file=sys.stderr)
+            sys.exit(1)
+
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+
+def pack_document(
+    input_dir, output_file, validate=False, jobs=1, listener=None, deterministic=False
+):
+    """Pack a directory into an Office file (.docx/.pptx/.xlsx).
+
+    Args:
+        input_dir: Path to unpacked Office document directory
+        output_file: Path to output Office file
+        validate: If True, validates with soffice (default: False)
+        jobs: Number of worker processes for condensing XML parts
+              (default: 1, condense serially in this process)
+        listener: Optional soffice.SofficeListener used for validation
+        deterministic: Write entries in canonical order with fixed timestamps
+              and permissions, so the same input always gives the same bytes.
+              The content hash is stored in the archive comment, and an
+              output that already holds the same hash is not rewritten.
+
+    Returns:
+        bool: True if successful, False if validation failed
+    """
+    input_dir = Path(input_dir)
+    output_file = Path(output_file)
+
+    if not input_dir.is_dir():
+        raise ValueError(f"{input_dir} is not a directory")
+    if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
+        raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
+
+    source_zip, lazy_parts = _open_lazy_source(input_dir)
+    with source_zip or contextlib.nullcontext():
+        # Stream every part straight into the archive; the input is never
+        # modified. Parts are listed first so an output file inside input_dir
+        # isn't packed.
+        parts = _list_parts(input_dir, canonical=deterministic, lazy_parts=lazy_parts)
+
+        if deterministic:
+            digest = _manifest_digest(_hash_parts(input_dir, parts, source_zip))
+            if read_pack_digest(output_file) == digest:
+                # Same content as the last deterministic pack: keep that file
+                if validate and not validate_document(output_file, listener=listener):
+                    output_file.unlink()  # Delete the corrupt file
+                    return False
+                return True
+
+        # The archive is written to a temporary file next to the output and
+        # moved into place once complete, so a failed pack keeps the previous
+        # output; lazy parts may also be read from the file being replaced
+        write_file = output_file.with_name(f".{output_file.name}.partial")
+        try:
+            _write_archive(
+                input_dir,
+                write_file,
+                parts,
+                source_zip,
+                jobs,
+                digest if deterministic else None,
+            )
+        except BaseException:
+            write_file.unlink(missing_ok=True)  # Don't leave a half-written file
+            raise
+
+    os.replace(write_file, output_file)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file, listener=listener):
+            output_file.unlink()  # Delete the corrupt file
+            return False
+
+    return True
+
+
+def _write_archive(input_dir, output_file, parts, source_zip, jobs, digest):
+    """Write parts to output_file; a digest makes the archive deterministic."""
+    xml_parts = [f for f in parts if isinstance(f, Path) and _is_xml_part(f)]
+    date_time = FIXED_DATE_TIME if digest is not None else None
+
+    # XML parts may be condensed by a pool, but this process alone writes the
+    # archive, in the same order as a serial run
+    executor = None
+    if jobs > 1 and len(xml_parts) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(xml_parts)))
+        condensed = executor.map(
+            _condense_part,
+            xml_parts,
+            chunksize=max(1, len(xml_parts) // (jobs * 4)),
+        )
+    else:
+        condensed = map(_condense_part, xml_parts)
+
+    try:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for f in parts:
+                if isinstance(f, zipfile.ZipInfo):
+                    copy_part(zf, source_zip, f, date_time)
+                    continue
+                data = next(condensed) if _is_xml_part(f) else None
+                write_part(zf, f, f.relative_to(input_dir), data, date_time)
+            if digest is not None:
+                zf.comment = DIGEST_COMMENT_PREFIX + digest.encode("ascii")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def write_part(zf, source_file, arcname, condensed=None, date_time=None):
+    """Write one part of an unpacked document into an open zip archive.
+
+    XML parts are condensed in memory, unless already condensed bytes are
+    passed in. Formats that are already compressed are stored as-is, and
+    everything else is deflated.
+
+    With date_time set, the entry gets that timestamp and fixed permissions
+    instead of the source file's, as deterministic packing needs.
+    """
+    compress_type = _compress_type(source_file.name)
+    if _is_xml_part(source_file) and condensed is None:
+        condensed = _condense_part(source_file)
+
+    if date_time is None:
+        if condensed is None:
+            zf.write(source_file, arcname, compress_type=compress_type)
+            return
+        zinfo = zipfile.ZipInfo.from_file(source_file, arcname)
+    else:
+        zinfo = zipfile.ZipInfo(Path(arcname).as_posix(), date_time=date_time)
+        zinfo.create_system = 3  # Unix, whatever platform packs
+        zinfo.external_attr = 0o100644 << 16  # Regular file, rw-r--r--
+    zinfo.compress_type = compress_type
+
+    if condensed is not None:
+        zf.writestr(zinfo, condensed)
+    else:
+        zinfo.file_size = source_file.stat().st_size  # Lets zipfile pick zip64
+        with open(source_file, "rb") as src, zf.open(zinfo, "w") as dest:
+            shutil.copyfileobj(src, dest, 1024 * 1024)
+
+
+def copy_part(zf, source_zip, info, date_time=None):
+    """Copy a part left in the original archive into an open zip archive.
+
+    The part is copied unchanged, not condensed. With date_time set, the
+    entry gets that timestamp and fixed permissions, as in write_part.
+    """
+    if date_time is None:
+        zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        zinfo.create_system = info.create_system
+        zinfo.external_attr = info.external_attr
+    else:
+        zinfo = zipfile.ZipInfo(info.filename, date_time=date_time)
+        zinfo.create_system = 3
+        zinfo.external_attr = 0o100644 << 16
+    zinfo.compress_type = _compress_type(info.filename)
+    zinfo.file_size = info.file_size
+
+    with source_zip.open(info) as src, zf.open(zinfo, "w") as dest:
+        shutil.copyfileobj(src, dest, 1024 * 1024)
+
+
+def pack_manifest(input_dir):
+    """Return the content-hash manifest of an unpacked document.
+
+    The digest is what a deterministic pack of input_dir stores in its
+    archive comment, so caches of packed output (thumbnails, validation
+    results) can key on it without packing.
+
+    Returns:
+        dict: {"version": int, "digest": str, "parts": {arcname: sha256}}
+    """
+    input_dir = Path(input_dir)
+    source_zip, lazy_parts = _open_lazy_source(input_dir)
+    with source_zip or contextlib.nullcontext():
+        parts = _list_parts(input_dir, canonical=True, lazy_parts=lazy_parts)
+        part_hashes = _hash_parts(input_dir, parts, source_zip)
+    return {
+        "version": PACK_FORMAT_VERSION,
+        "digest": _manifest_digest(part_hashes),
+        "parts": part_hashes,
+    }
+
+
+def read_pack_digest(office_file):
+    """Return the content hash stored by a deterministic pack, or None."""
+    try:
+        with zipfile.ZipFile(office_file) as zf:
+            comment = zf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if not comment.startswith(DIGEST_COMMENT_PREFIX):
+        return None
+    return comment[len(DIGEST_COMMENT_PREFIX) :].decode("ascii", "replace")
+
+
+def _open_lazy_source(input_dir):
+    """Open the original archive of a selectively unpacked directory.
+
+    Returns:
+        tuple: (open ZipFile, ZipInfos of the parts to copy from it), or
+        (None, []) for a directory unpacked in full
+    """
+    lazy = read_lazy_parts(input_dir)
+    if lazy is None:
+        return None, []
+    source, names = lazy
+    if not names:
+        return None, []
+
+    try:
+        source_zip = zipfile.ZipFile(source)
+    except (OSError, zipfile.BadZipFile) as e:
+        raise ValueError(
+            f"{input_dir} was partially unpacked from {source}, "
+            f"which can no longer be read: {e}"
+        ) from e
+    try:
+        return source_zip, [source_zip.getinfo(name) for name in names]
+    except KeyError as e:
+        source_zip.close()
+        raise ValueError(
+            f"{input_dir} was partially unpacked from {source}, "
+            f"which no longer contains part {e}"
+        ) from None
+
+
+def _list_parts(input_dir, canonical=False, lazy_parts=()):
+    """List the parts to pack, in rglob order or canonical archive order.
+
+    Files in input_dir are Paths; lazy_parts are ZipInfos of parts left in the
+    original archive, listed after the files unless in canonical order.
+    Canonical order is [Content_Types].xml first, then by archive name.
+    """
+    parts = [
+        f
+        for f in input_dir.rglob("*")
+        if f.is_file() and f.relative_to(input_dir).as_posix() != LAZY_SOURCE_FILE
+    ]
+    parts += lazy_parts
+    if canonical:
+        parts.sort(
+            key=lambda f: (
+                _arcname(input_dir, f) != CONTENT_TYPES_PART,
+                _arcname(input_dir, f),
+            )
+        )
+    return parts
+
+
+def _arcname(input_dir, part):
+    if isinstance(part, zipfile.ZipInfo):
+        return part.filename
+    return part.relative_to(input_dir).as_posix()
+
+
+def _hash_parts(input_dir, parts, source_zip=None):
+    """Return {arcname: sha256 of the source bytes} in the order of parts."""
+    part_hashes = {}
+    for f in parts:
+        sha256 = hashlib.sha256()
+        if isinstance(f, zipfile.ZipInfo):
+            src = source_zip.open(f)
+        else:
+            src = open(f, "rb")
+        with src:
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        part_hashes[_arcname(input_dir, f)] = sha256.hexdigest()
+    return part_hashes
+
+
+def _manifest_digest(part_hashes):
+    """Combine per-part hashes and the pack format into one content hash."""
+    lines = [f"ooxml-pack {PACK_FORMAT_VERSION}\n"]
+    lines += [f"{part_hash}  {name}\n" for name, part_hash in part_hashes.items()]
+    return hashlib.sha256("".join(lines).encode("utf-8")).hexdigest()
+
+
+def _is_xml_part(path):
+    return path.name.endswith((".xml", ".rels"))
+
+
+def _compress_type(name):
+    """Store formats that are already compressed and deflate the rest."""
+    if name.endswith((".xml", ".rels")):
+        return zipfile.ZIP_DEFLATED
+    if Path(name).suffix.lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _condense_part(path):
+    """Return the condensed bytes of an XML part; runs in pool workers too."""
+    return condense_xml_bytes(path.read_bytes())
+
+
+def validate_document(doc_path, listener=None):
+    """Validate document by converting to HTML with soffice.
+
+    Conversions go to a long-lived soffice listener when one is given or
+    enabled with OOXML_SOFFICE_LISTENER=1 (see soffice.py), and otherwise, or
+    if the listener is unavailable, to a one-shot soffice process.
+    """
+    # Determine the correct filter based on file extension
+    match doc_path.suffix.lower():
+        case ".docx":
+            filter_name = "html:HTML"
+        case ".pptx":
+            filter_name = "html:impress_html_Export"
+        case ".xlsx":
+            filter_name = "html:HTML (StarCalc)"
+
+    if listener is None:
+        listener = default_listener()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if listener is not None:
+            try:
+                listener.convert(doc_path, filter_name.split(":", 1)[1], temp_dir)
+                if (Path(temp_dir) / f"{doc_path.stem}.html").exists():
+                    return True
+                print("Validation error: Document validation failed", file=sys.stderr)
+                return False
+            except ListenerUnavailable:
+                pass  # Fall back to a one-shot soffice process
+            except TimeoutError:
+                print("Validation error: Timeout during conversion", file=sys.stderr)
+                return False
+            except ConversionFailed as e:
+                print(f"Validation error: {e}", file=sys.stderr)
+                return False
+
+        try:
+            result = subprocess.run(
+                [
+                    "soffice",
+                    "--headless",
+                    "--convert-to",
+                    filter_name,
+                    "--outdir",
+                    temp_dir,
+                    str(doc_path),
+                ],
+                capture_output=True,
+                timeout=10,
+                text=True,
+            )
+            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
+                error_msg = result.stderr.strip() or "Document validation failed"
+                print(f"Validation error: {error_msg}", file=sys.stderr)
+                return False
+            return True
+        except FileNotFoundError:
+            print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
+            return True
+        except subprocess.TimeoutExpired:
+            print("Validation error: Timeout during conversion", file=sys.stderr)
+            return False
+        except Exception as e:
+            print(f"Validation error: {e}", file=sys.stderr)
+            return False
+
+
+def condense_xml(xml_file, engine=DEFAULT_ENGINE):
+    """Strip unnecessary whitespace and remove comments from a file in place."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_bytes(xml_file.read_bytes(), engine=engine))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from .pack import pack_document
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>
+"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>
+"""
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p>
+      <w:r>
+        <w:t>Hello</w:t>
+      </w:r>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+
+# Run from skills/_shared with: python -m unittest ooxml.pack_test
+class TestPackDocument(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+        self.input_dir = self.root / "unpacked"
+        for name, text in [
+            ("[Content_Types].xml", CONTENT_TYPES),
+            ("_rels/.rels", ROOT_RELS),
+            ("word/document.xml", DOCUMENT),
+        ]:
+            path = self.input_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+
+        self.output_file = self.root / "out.docx"
+        self.partial_file = self.root / ".out.docx.partial"
+
+    def break_document(self):
+        """Make word/document.xml malformed, so condensing it fails."""
+        (self.input_dir / "word" / "document.xml").write_text("<w:document>")
+
+    def test_pack_writes_output_without_partial_file(self):
+        self.assertTrue(pack_document(self.input_dir, self.output_file))
+        self.assertTrue(self.output_file.is_file())
+        self.assertFalse(self.partial_file.exists())
+
+    def test_failed_pack_keeps_previous_output(self):
+        pack_document(self.input_dir, self.output_file)
+        previous = self.output_file.read_bytes()
+
+        self.break_document()
+        with self.assertRaises(Exception):
+            pack_document(self.input_dir, self.output_file)
+
+        self.assertEqual(self.output_file.read_bytes(), previous)
+        self.assertFalse(self.partial_file.exists())
+
+    def test_failed_pack_without_previous_output_leaves_nothing(self):
+        self.break_document()
+        with self.assertRaises(Exception):
+            pack_document(self.input_dir, self.output_file)
+
+        self.assertFalse(self.output_file.exists())
+        self.assertFalse(self.partial_file.exists())
+
+    def test_failed_pack_in_worker_leaves_no_partial_file(self):
+        (self.input_dir / "word" / "extra.xml").write_text(DOCUMENT)
+        pack_document(self.input_dir, self.output_file)
+        previous = self.output_file.read_bytes()
+
+        self.break_document()
+        with self.assertRaises(Exception):
+            pack_document(self.input_dir, self.output_file, jobs=2)
+
+        self.assertEqual(self.output_file.read_bytes(), previous)
+        self.assertFalse(self.partial_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,391 @@
+"""
+Long-lived headless LibreOffice for validating packed documents.
+
+Starting soffice for every conversion costs seconds. A SofficeListener keeps
+one headless instance listening on a named pipe and submits conversions to it
+over UNO, restarting it if it crashes or hangs. It needs LibreOffice's Python
+bridge (the "uno" module); without it, or whenever the listener cannot be
+reached, callers fall back to a one-shot `soffice --convert-to` run.
+
+Set OOXML_SOFFICE_LISTENER=1 to let pack.py validate through a shared listener
+that outlives the process, so later packs in an editing session reuse it.
+
+Usage:
+    python -m ooxml.soffice start   # Start the shared listener
+    python -m ooxml.soffice stop    # Stop the shared listener
+"""
+
+import argparse
+import atexit
+import getpass
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from stat import S_ISDIR
+
+# Environment variable that enables the shared listener in pack.py
+LISTENER_ENV_VAR = "OOXML_SOFFICE_LISTENER"
+
+# Shared listener returned by default_listener(), created on first use
+_DEFAULT_LISTENER = None
+
+
+class ListenerUnavailable(Exception):
+    """The listener could not be started or reached; use the one-shot path."""
+
+
+class ConversionFailed(Exception):
+    """LibreOffice could not load or convert the document."""
+
+
+class SofficeListener:
+    """A headless LibreOffice instance that converts documents over UNO.
+
+    The instance is started on first use, or reused if one is already
+    listening on the same pipe (e.g. started by an earlier process). At most
+    max_concurrency conversions run at once; further callers wait.
+    """
+
+    def __init__(
+        self, name=None, max_concurrency=1, startup_timeout=30, detach=False
+    ):
+        """
+        Args:
+            name: Pipe name, which also names the LibreOffice profile directory
+                  (default: one per user, shared between processes)
+            max_concurrency: Number of conversions submitted at the same time
+            startup_timeout: Seconds to wait for a new instance to accept
+                  connections
+            detach: Keep the instance running after this process exits, so
+                  other processes can reuse it. Otherwise it is stopped at exit.
+        """
+        self.name = name or f"ooxml-soffice-{getpass.getuser()}"
+        self.profile_dir = Path(tempfile.gettempdir()) / self.name
+        self.startup_timeout = startup_timeout
+        self.detach = detach
+
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()  # Guards starting and stopping
+        self._process = None
+        self._desktop = None
+        self._timed_out = threading.Event()
+
+        if not detach:
+            atexit.register(self._stop_if_started)
+
+    def start(self):
+        """Start the instance, or connect to one already listening on the pipe."""
+        self._connect()
+
+    def convert(self, doc_path, filter_name, out_dir, timeout=10):
+        """Convert a document to HTML in out_dir.
+
+        Args:
+            doc_path: Path to the document
+            filter_name: LibreOffice export filter (e.g. "HTML (StarCalc)")
+            out_dir: Directory receiving "<stem>.html"
+            timeout: Seconds a conversion may take before the instance is
+                  killed and restarted on next use
+
+        Raises:
+            ListenerUnavailable: If no instance can be started or reached
+            ConversionFailed: If the document could not be loaded or converted
+            TimeoutError: If the conversion took longer than timeout
+        """
+        with self._slots:
+            # A crashed instance is restarted once before giving up
+            for _ in range(2):
+                desktop = self._connect()
+                try:
+                    self._convert(desktop, doc_path, filter_name, out_dir, timeout)
+                    return
+                except Exception as e:
+                    if self._timed_out.is_set():
+                        self._reset()
+                        raise TimeoutError("Timeout during conversion") from e
+                    if self._is_alive(desktop):
+                        message = getattr(e, "Message", "") or str(e)
+                        raise ConversionFailed(message or type(e).__name__) from e
+                    self._reset()
+
+        raise ListenerUnavailable("soffice listener crashed twice in a row")
+
+    def stop(self):
+        """Shut the instance down, whether this or another process started it.
+
+        An instance started by another process is asked to terminate over
+        UNO, and only killed if it is verifiably this listener's soffice.
+        """
+        with self._lock:
+            desktop, self._desktop = self._desktop, None
+            if desktop is None:
+                try:
+                    desktop = self._resolve()
+                except Exception:
+                    desktop = None
+            if desktop is not None:
+                try:
+                    desktop.terminate()
+                except Exception:
+                    pass  # The bridge drops while soffice exits
+            self._kill()
+
+    def _stop_if_started(self):
+        if self._process is not None:
+            self.stop()
+
+    def _connect(self):
+        """Return the instance's Desktop, starting the instance if needed."""
+        with self._lock:
+            if self._desktop is None:
+                _import_uno()
+                from com.sun.star.connection import NoConnectException
+
+                try:
+                    self._desktop = self._resolve()
+                except NoConnectException:
+                    self._desktop = self._start()
+            return self._desktop
+
+    def _resolve(self):
+        uno = _import_uno()
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        context = resolver.resolve(
+            f"uno:pipe,name={self.name};urp;StarOffice.ComponentContext"
+        )
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def _start(self):
+        from com.sun.star.connection import NoConnectException
+
+        soffice = shutil.which("soffice")
+        if soffice is None:
+            raise ListenerUnavailable("soffice not found")
+
+        self._make_profile_dir()
+        self._process = subprocess.Popen(
+            [
+                soffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                "--nodefault",
+                "--nolockcheck",
+                f"-env:UserInstallation={self.profile_dir.as_uri()}",
+                f"--accept=pipe,name={self.name};urp;StarOffice.ComponentContext",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=self.detach,
+        )
+        # Lets another process kill an instance it did not start
+        self._pid_file.write_text(str(self._process.pid))
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            try:
+                return self._resolve()
+            except NoConnectException:
+                if self._process.poll() is not None:
+                    raise ListenerUnavailable("soffice exited during startup")
+                time.sleep(0.1)
+
+        self._kill()
+        raise ListenerUnavailable(
+            f"soffice did not accept connections within {self.startup_timeout}s"
+        )
+
+    def _convert(self, desktop, doc_path, filter_name, out_dir, timeout):
+        uno = _import_uno()
+        doc_path = Path(doc_path).resolve()
+        out_file = Path(out_dir).resolve() / f"{doc_path.stem}.html"
+
+        # A hung conversion is ended by killing the instance, which makes the
+        # pending UNO call fail
+        self._timed_out.clear()
+        watchdog = threading.Timer(timeout, self._kill_after_timeout)
+        watchdog.start()
+        document = None
+        try:
+            document = desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(doc_path)),
+                "_blank",
+                0,
+                _properties(Hidden=True, ReadOnly=True),
+            )
+            if document is None:
+                raise ConversionFailed("Document could not be loaded")
+            document.storeToURL(
+                uno.systemPathToFileUrl(str(out_file)),
+                _properties(FilterName=filter_name, Overwrite=True),
+            )
+        finally:
+            watchdog.cancel()
+            if document is not None:
+                try:
+                    document.close(True)
+                except Exception:
+                    pass
+
+    def _is_alive(self, desktop):
+        try:
+            desktop.getCurrentComponent()
+            return True
+        except Exception:
+            return False
+
+    def _kill_after_timeout(self):
+        self._timed_out.set()
+        self._kill()
+
+    def _reset(self):
+        """Forget the current instance; the next conversion starts a new one."""
+        with self._lock:
+            self._desktop = None
+            self._kill()
+
+    def _kill(self):
+        """Kill the instance if it is still running.
+
+        An instance started by another process is only killed if its PID,
+        read from the pid file, still belongs to a soffice running on this
+        listener's profile; the PID may be stale and reused by now.
+        """
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        elif not self._owns_profile_dir():
+            return  # Someone else's directory, so not our pid file either
+        elif self._pid_file.exists():
+            try:
+                pid = int(self._pid_file.read_text())
+                if self._is_instance(pid):
+                    os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            except (OSError, ValueError):
+                pass  # Already gone
+        self._pid_file.unlink(missing_ok=True)
+
+    def _is_instance(self, pid):
+        """Return True if pid is a soffice process using this listener's profile."""
+        args = _command_line(pid)
+        if not args:
+            return False
+        program = Path(args[0]).name
+        return program.startswith(("soffice", "oosplash")) and (
+            f"-env:UserInstallation={self.profile_dir.as_uri()}" in args
+        )
+
+    def _make_profile_dir(self):
+        """Create the profile directory, private to the current user.
+
+        Its name is predictable and it lives in the shared temp directory, so
+        an existing directory owned by someone else is refused.
+        """
+        self.profile_dir.mkdir(mode=0o700, exist_ok=True)
+        if not self._owns_profile_dir():
+            raise ListenerUnavailable(
+                f"{self.profile_dir} is not a directory owned by the current user"
+            )
+        self.profile_dir.chmod(0o700)
+
+    def _owns_profile_dir(self):
+        """Return True if the profile directory is a real directory of this user."""
+        try:
+            stat = self.profile_dir.lstat()
+        except OSError:
+            return False
+        if not S_ISDIR(stat.st_mode):
+            return False  # Also rejects a symlink planted in its place
+        return not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+
+    @property
+    def _pid_file(self):
+        return self.profile_dir / "listener.pid"
+
+
+def default_listener():
+    """Return the shared listener if OOXML_SOFFICE_LISTENER is enabled, else None."""
+    global _DEFAULT_LISTENER
+    if os.environ.get(LISTENER_ENV_VAR, "").lower() not in ("1", "true", "yes"):
+        return None
+    if _DEFAULT_LISTENER is None:
+        _DEFAULT_LISTENER = SofficeListener(detach=True)
+    return _DEFAULT_LISTENER
+
+
+def _command_line(pid):
+    """Return the command line arguments of a running process, or None if unknown."""
+    if Path("/proc").is_dir():
+        try:
+            raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+        except OSError:
+            return None  # No such process
+        return [arg.decode(errors="replace") for arg in raw.split(b"\0") if arg]
+
+    # No /proc (e.g. macOS); ps prints the arguments joined by spaces
+    try:
+        result = subprocess.run(
+            ["ps", "-ww", "-o", "command=", "-p", str(pid)],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.split()
+
+
+def _import_uno():
+    """Import LibreOffice's Python bridge, which is not on PyPI."""
+    try:
+        import uno
+    except ImportError as e:
+        raise ListenerUnavailable("LibreOffice Python bridge (uno) not found") from e
+    return uno
+
+
+def _properties(**values):
+    from com.sun.star.beans import PropertyValue
+
+    return tuple(
+        PropertyValue(Name=name, Value=value) for name, value in values.items()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage the shared headless LibreOffice used for validation"
+    )
+    parser.add_argument("command", choices=["start", "stop"])
+    args = parser.parse_args()
+
+    listener = SofficeListener(detach=True)
+    try:
+        if args.command == "start":
+            listener.start()
+            print(f"soffice listener running on pipe {listener.name}")
+        else:
+            listener.stop()
+            print(f"soffice listener on pipe {listener.name} stopped")
+    except ListenerUnavailable as e:
+        sys.exit(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
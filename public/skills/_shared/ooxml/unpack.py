@@ -0,0 +1,171 @@
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
+
+Example usage, through the launcher of the docx or pptx skill:
+    python ooxml/scripts/unpack.py <office_file> <output_dir> [--jobs N]
+        [--only PATTERN ...]
+
+or as a module from skills/_shared:
+    python -m ooxml.unpack <office_file> <output_dir> ...
+
+With --only, only the parts matching a pattern are extracted and formatted,
+together with the package skeleton ([Content_Types].xml and the .rels files)
+that validation needs. The others stay in the original file, which is
+recorded in the output directory; pack.py copies them from there, so the
+original must be kept in place until the document is packed.
+"""
+
+import argparse
+import fnmatch
+import glob
+import json
+import random
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .formatting import DEFAULT_ENGINE, pretty_xml_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for pretty-printing XML parts (default: 1)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="PATTERN",
+        help="Extract only parts whose archive name matches this glob "
+        "(e.g. 'word/document.xml', 'ppt/slides/*'); may be repeated. "
+        "The other parts are left in office_file until packing",
+    )
+    args = parser.parse_args()
+    input_file = args.office_file
+
+    unpack_document(input_file, args.output_dir, jobs=args.jobs, only=args.only)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+# File in a selectively unpacked directory naming the archive that still holds
+# the parts that were not extracted
+LAZY_SOURCE_FILE = ".ooxml-source.json"
+
+# Parts extracted whatever --only says: the content types and relationships
+# are needed to validate the package and are small
+SKELETON_PATTERNS = (glob.escape("[Content_Types].xml"), "*.rels")
+
+
+def unpack_document(input_file, output_dir, engine=DEFAULT_ENGINE, jobs=1, only=None):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the Office file (.docx/.pptx/.xlsx)
+        output_dir: Directory to extract into, created if missing
+        engine: XML engine used for pretty-printing, see formatting.ENGINES
+        jobs: Number of worker processes for pretty-printing
+              (default: 1, format serially in this process)
+        only: Optional glob patterns matched against archive names
+              (fnmatch rules, so "*" also matches "/"). Only matching parts
+              and the skeleton (SKELETON_PATTERNS) are extracted; the rest
+              are recorded as lazy parts that pack_document copies from
+              input_file. Unpacking again into the same directory extracts
+              further parts; skeleton parts already there are kept, since
+              they may have been edited.
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    lazy_source_file = output_path / LAZY_SOURCE_FILE
+
+    with zipfile.ZipFile(input_file) as zf:
+        names = [name for name in zf.namelist() if not name.endswith("/")]
+        if only:
+            members = [
+                name
+                for name in names
+                if _matches(name, only)
+                or (
+                    _matches(name, SKELETON_PATTERNS)
+                    and not (output_path / name).exists()
+                )
+            ]
+        else:
+            members = names
+        zf.extractall(output_path, members)
+
+    if only:
+        # Parts already extracted are found on disk by pack_document, so
+        # listing every other part is right for repeated unpacks as well
+        extracted = set(members)
+        lazy_source_file.write_text(
+            json.dumps(
+                {
+                    "source": str(Path(input_file).resolve()),
+                    "parts": [name for name in names if name not in extracted],
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+    else:
+        lazy_source_file.unlink(missing_ok=True)  # Every part is on disk now
+
+    # Pretty print the extracted XML files
+    xml_files = [
+        output_path / name for name in members if name.endswith((".xml", ".rels"))
+    ]
+    if jobs > 1 and len(xml_files) > 1:
+        # Parts are independent files, so workers rewrite them in place
+        with ProcessPoolExecutor(max_workers=min(jobs, len(xml_files))) as executor:
+            # Consume the results so a worker's error is raised here
+            list(
+                executor.map(
+                    _pretty_print_file,
+                    xml_files,
+                    [engine] * len(xml_files),
+                    chunksize=max(1, len(xml_files) // (jobs * 4)),
+                )
+            )
+    else:
+        for xml_file in xml_files:
+            _pretty_print_file(xml_file, engine)
+
+
+def read_lazy_parts(unpacked_dir):
+    """Return (source archive, lazy part names) of a selectively unpacked directory.
+
+    Lazy parts that have since been extracted are left out. Returns None for a
+    directory unpacked in full.
+    """
+    unpacked_dir = Path(unpacked_dir)
+    lazy_source_file = unpacked_dir / LAZY_SOURCE_FILE
+    if not lazy_source_file.is_file():
+        return None
+    record = json.loads(lazy_source_file.read_text())
+    parts = [name for name in record["parts"] if not (unpacked_dir / name).exists()]
+    return Path(record["source"]), parts
+
+
+def _matches(name, patterns):
+    """Return True if an archive name matches any of the glob patterns."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def _pretty_print_file(xml_file, engine):
+    """Pretty-print one extracted XML part in place; runs in pool workers too."""
+    xml_file.write_bytes(pretty_xml_bytes(xml_file.read_bytes(), engine=engine))
+
+
+if __name__ == "__main__":
+    main()
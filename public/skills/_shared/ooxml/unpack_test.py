@@ -0,0 +1,115 @@
+import contextlib
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from .pack import pack_document
+from .unpack import LAZY_SOURCE_FILE, read_lazy_parts, unpack_document
+from .validate import run_validators
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+PARTS = {
+    "[Content_Types].xml": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Default Extension="png" ContentType="image/png"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+</Types>""",
+    "_rels/.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="{RELATIONSHIPS}/officeDocument" Target="word/document.xml"/>
+</Relationships>""",
+    "word/_rels/document.xml.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="{RELATIONSHIPS}/styles" Target="styles.xml"/>
+<Relationship Id="rId2" Type="{RELATIONSHIPS}/image" Target="media/image1.png"/>
+</Relationships>""",
+    "word/document.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NAMESPACE}"><w:body><w:p><w:r><w:t>Hello</w:t></w:r></w:p></w:body></w:document>""",
+    "word/styles.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NAMESPACE}"/>""",
+    "word/media/image1.png": "not really a png",
+}
+
+
+# Run from skills/_shared with: python -m unittest ooxml.unpack_test
+class TestSelectiveUnpack(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+        self.original = self.root / "original.docx"
+        with zipfile.ZipFile(self.original, "w") as zf:
+            for name, text in PARTS.items():
+                zf.writestr(name, text)
+
+        self.unpacked = self.root / "unpacked"
+        unpack_document(self.original, self.unpacked, only=["word/document.xml"])
+
+    def validate(self):
+        """Run the validators the docx launcher runs; return True if all pass."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            success, _ = run_validators(self.unpacked, self.original, ".docx", False, 1)
+        return success
+
+    def test_skeleton_is_always_unpacked(self):
+        on_disk = {
+            path.relative_to(self.unpacked).as_posix()
+            for path in self.unpacked.rglob("*")
+            if path.is_file()
+        }
+        self.assertEqual(
+            on_disk,
+            {
+                "[Content_Types].xml",
+                "_rels/.rels",
+                "word/_rels/document.xml.rels",
+                "word/document.xml",
+                LAZY_SOURCE_FILE,
+            },
+        )
+        _, lazy_parts = read_lazy_parts(self.unpacked)
+        self.assertEqual(set(lazy_parts), {"word/styles.xml", "word/media/image1.png"})
+
+    def test_unpack_validate_pack(self):
+        document = self.unpacked / "word" / "document.xml"
+        document.write_text(document.read_text().replace("Hello", "Hello again"))
+
+        self.assertTrue(self.validate())
+
+        packed = self.root / "packed.docx"
+        self.assertTrue(pack_document(self.unpacked, packed))
+        with zipfile.ZipFile(packed) as zf, zipfile.ZipFile(self.original) as original:
+            self.assertEqual(sorted(zf.namelist()), sorted(original.namelist()))
+            for name in ["word/styles.xml", "word/media/image1.png"]:
+                self.assertEqual(zf.read(name), original.read(name))
+            self.assertIn(b"Hello again", zf.read("word/document.xml"))
+
+    def test_broken_reference_to_missing_part_fails_validation(self):
+        rels = self.unpacked / "word" / "_rels" / "document.xml.rels"
+        rels.write_text(rels.read_text().replace("styles.xml", "missing.xml"))
+
+        self.assertFalse(self.validate())
+
+    def test_unpacking_again_keeps_edited_skeleton(self):
+        content_types = self.unpacked / "[Content_Types].xml"
+        content_types.write_text(
+            content_types.read_text().replace("</Types>", "<!-- edited --></Types>")
+        )
+
+        unpack_document(self.original, self.unpacked, only=["word/styles.xml"])
+
+        self.assertIn("<!-- edited -->", content_types.read_text())
+        self.assertTrue((self.unpacked / "word" / "styles.xml").is_file())
+        self.assertEqual(read_lazy_parts(self.unpacked)[1], ["word/media/image1.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
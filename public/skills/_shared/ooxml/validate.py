@@ -0,0 +1,299 @@
+"""
+Command line tool to validate Office document XML files against XSD schemas and tracked changes.
+
+Usage, through the launcher of the docx or pptx skill:
+    python ooxml/scripts/validate.py <dir> --original <original_file> [--format json]
+    python ooxml/scripts/validate.py --batch <manifest_or_glob> [--format json] [-j N]
+
+or as a module from skills/_shared: python -m ooxml.validate ...
+
+Batch mode validates many documents in one process, sharing compiled schemas
+and the worker pool. The batch source is either a manifest file with one
+"<unpacked_dir>\t<original_file>" pair per line (relative paths are resolved
+against the manifest's directory, blank lines and "#" comments are ignored),
+or a glob of original files whose unpacked directories sit next to them
+without the extension (reports/a.docx -> reports/a/).
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate Office document XML files")
+    parser.add_argument(
+        "unpacked_dir",
+        nargs="?",
+        help="Path to unpacked Office document directory",
+    )
+    parser.add_argument(
+        "--original",
+        help="Path to original file (.docx/.pptx/.xlsx)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST_OR_GLOB",
+        help="Validate many documents: a manifest of '<unpacked_dir>\\t<original>' "
+        "lines or a glob of original files unpacked next to them",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose output",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-part XSD validation (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format; json prints per-check results and timings to stdout "
+        "and sends the text report to stderr; in batch mode one JSON object is "
+        "printed per document as it finishes (default: text)",
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        if args.unpacked_dir or args.original:
+            parser.error("--batch cannot be combined with unpacked_dir or --original")
+        success = run_batch(args.batch, args.format, args.verbose, args.jobs)
+        sys.exit(0 if success else 1)
+
+    if not args.unpacked_dir or not args.original:
+        parser.error("unpacked_dir and --original are required without --batch")
+
+    # Validate paths
+    unpacked_dir = Path(args.unpacked_dir)
+    original_file = Path(args.original)
+    file_extension = original_file.suffix.lower()
+    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert original_file.is_file(), f"Error: {original_file} is not a file"
+    assert file_extension in [".docx", ".pptx", ".xlsx"], (
+        f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
+    )
+
+    if file_extension not in [".docx", ".pptx"]:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
+
+    if args.format == "json":
+        report = validate_to_report(
+            unpacked_dir, original_file, file_extension, args.verbose, args.jobs
+        )
+        success = report["passed"]
+        print(json.dumps(report, indent=2))
+    else:
+        success, _ = run_validators(
+            unpacked_dir, original_file, file_extension, args.verbose, args.jobs
+        )
+        if success:
+            print("All validations PASSED!")
+
+    sys.exit(0 if success else 1)
+
+
+def run_validators(
+    unpacked_dir, original_file, file_extension, verbose, jobs, executor=None
+):
+    """Run the validators for a file type.
+
+    Returns:
+        tuple: (success, validators) where validators hold per-check results
+    """
+    match file_extension:
+        case ".docx":
+            validators = [
+                DOCXSchemaValidator(
+                    unpacked_dir,
+                    original_file,
+                    verbose=verbose,
+                    jobs=jobs,
+                    executor=executor,
+                ),
+                RedliningValidator(unpacked_dir, original_file, verbose=verbose),
+            ]
+        case ".pptx":
+            validators = [
+                PPTXSchemaValidator(
+                    unpacked_dir,
+                    original_file,
+                    verbose=verbose,
+                    jobs=jobs,
+                    executor=executor,
+                ),
+            ]
+
+    # Run validators
+    success = True
+    for validator in validators:
+        if not validator.validate():
+            success = False
+
+    return success, validators
+
+
+def validate_to_report(
+    unpacked_dir, original_file, file_extension, verbose, jobs, executor=None
+):
+    """Run the validators with text output on stderr and return a JSON report dict."""
+    # Keep stdout for the JSON document only
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        success, validators = run_validators(
+            unpacked_dir, original_file, file_extension, verbose, jobs, executor
+        )
+    return {
+        "unpacked_dir": str(unpacked_dir),
+        "original": str(original_file),
+        "passed": success,
+        "duration": round(time.perf_counter() - start, 6),
+        "checks": [result for v in validators for result in v.results],
+    }
+
+
+def load_batch(source):
+    """Return the (unpacked_dir, original_file) pairs of a manifest or glob.
+
+    Args:
+        source: Path to a manifest file, or a glob of original files
+
+    Returns:
+        list: [(Path, Path)] in manifest or sorted glob order
+    """
+    manifest = Path(source)
+    is_office_file = manifest.suffix.lower() in [".docx", ".pptx", ".xlsx"]
+    if manifest.is_file() and not is_office_file:
+        pairs = []
+        for line_number, line in enumerate(
+            manifest.read_text(encoding="utf-8").splitlines(), 1
+        ):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t") if "\t" in line else line.split()
+            if len(fields) != 2:
+                raise ValueError(
+                    f"{manifest}:{line_number}: expected '<unpacked_dir>\\t<original>'"
+                )
+            unpacked_dir, original_file = (
+                manifest.parent / field.strip() for field in fields
+            )
+            pairs.append((unpacked_dir, original_file))
+        return pairs
+
+    # Unpacked directories matched by the same glob are not documents
+    original_files = [
+        Path(path)
+        for path in sorted(glob.glob(source, recursive=True))
+        if Path(path).suffix.lower() in [".docx", ".pptx", ".xlsx"]
+    ]
+    return [
+        (original_file.with_suffix(""), original_file)
+        for original_file in original_files
+    ]
+
+
+def run_batch(source, output_format, verbose, jobs):
+    """Validate every document of a batch, reporting each one as it finishes.
+
+    Compiled schemas and, with jobs > 1, a single worker pool are shared by all
+    documents. Returns True if every document passed.
+    """
+    try:
+        pairs = load_batch(source)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return False
+
+    if not pairs:
+        print(f"Error: No documents found for {source}", file=sys.stderr)
+        return False
+
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    passed_count = 0
+    start = time.perf_counter()
+
+    try:
+        for unpacked_dir, original_file in pairs:
+            file_extension = original_file.suffix.lower()
+            error = None
+            if not unpacked_dir.is_dir():
+                error = f"{unpacked_dir} is not a directory"
+            elif not original_file.is_file():
+                error = f"{original_file} is not a file"
+            elif file_extension not in [".docx", ".pptx"]:
+                error = f"Validation not supported for file type {file_extension}"
+
+            if output_format == "json":
+                if error is None:
+                    try:
+                        report = validate_to_report(
+                            unpacked_dir,
+                            original_file,
+                            file_extension,
+                            verbose,
+                            jobs,
+                            executor,
+                        )
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                if error is not None:
+                    report = {
+                        "unpacked_dir": str(unpacked_dir),
+                        "original": str(original_file),
+                        "passed": False,
+                        "error": error,
+                    }
+                passed = report["passed"]
+                print(json.dumps(report), flush=True)
+            else:
+                print(f"=== {unpacked_dir} ({original_file}) ===")
+                passed = False
+                if error is None:
+                    try:
+                        passed, _ = run_validators(
+                            unpacked_dir,
+                            original_file,
+                            file_extension,
+                            verbose,
+                            jobs,
+                            executor,
+                        )
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                if error is not None:
+                    print(f"Error: {error}")
+                elif passed:
+                    print("All validations PASSED!")
+                print(flush=True)
+
+            if passed:
+                passed_count += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print(
+        f"Validated {len(pairs)} documents in {time.perf_counter() - start:.1f}s: "
+        f"{passed_count} passed, {len(pairs) - passed_count} failed",
+        file=sys.stderr,
+    )
+    return passed_count == len(pairs)
+
+
+if __name__ == "__main__":
+    main()
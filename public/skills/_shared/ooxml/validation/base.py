@@ -0,0 +1,1217 @@
+"""
+Base validator with common validation logic for document files.
+"""
+
+import copy
+import functools
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import lxml.etree
+
+from ..unpack import LAZY_SOURCE_FILE, read_lazy_parts
+from .original import OriginalPackage
+from .results import check_error, print_errors, recorded_check
+
+# Template placeholders ({{ ... }}) stripped from text before XSD validation
+TEMPLATE_TAG_PATTERN = re.compile(r"\{\{[^}]*\}\}")
+
+# Compiled XSD schemas shared by every validator in the process, keyed by schema path
+_SCHEMA_CACHE = {}
+
+# Validator owned by a worker process, reused while its document's parts arrive
+_WORKER_VALIDATOR = None
+
+
+def _validate_file_against_xsd_in_worker(
+    validator_class, unpacked_dir, original_file, xml_file
+):
+    """Run validate_file_against_xsd for one part inside a pool worker.
+
+    Pools may be shared by validators of different documents, so the
+    worker's validator is replaced whenever a part of another document
+    arrives. Compiled schemas stay cached in the worker either way.
+    """
+    global _WORKER_VALIDATOR
+    validator = _WORKER_VALIDATOR
+    if (
+        validator is None
+        or type(validator) is not validator_class
+        or validator.unpacked_dir != unpacked_dir
+        or validator.original_file != original_file
+    ):
+        validator = _WORKER_VALIDATOR = validator_class(unpacked_dir, original_file)
+    return validator.validate_file_against_xsd(xml_file, verbose=False)
+
+
+class BaseSchemaValidator:
+    """Base validator with common validation logic for document files."""
+
+    # Elements whose 'id' attributes must be unique within their file
+    # Format: element_name -> (attribute_name, scope)
+    # scope can be 'file' (unique within file) or 'global' (unique across all files)
+    UNIQUE_ID_REQUIREMENTS = {
+        # Word elements
+        "comment": ("id", "file"),  # Comment IDs in comments.xml
+        "commentrangestart": ("id", "file"),  # Must match comment IDs
+        "commentrangeend": ("id", "file"),  # Must match comment IDs
+        "bookmarkstart": ("id", "file"),  # Bookmark start IDs
+        "bookmarkend": ("id", "file"),  # Bookmark end IDs
+        # Note: ins and del (track changes) can share IDs when part of same revision
+        # PowerPoint elements
+        "sldid": ("id", "file"),  # Slide IDs in presentation.xml
+        "sldmasterid": ("id", "global"),  # Slide master IDs must be globally unique
+        "sldlayoutid": ("id", "global"),  # Slide layout IDs must be globally unique
+        "cm": ("authorid", "file"),  # Comment author IDs
+        # Excel elements
+        "sheet": ("sheetid", "file"),  # Sheet IDs in workbook.xml
+        "definedname": ("id", "file"),  # Named range IDs
+        # Drawing/Shape elements (all formats)
+        "cxnsp": ("id", "file"),  # Connection shape IDs
+        "sp": ("id", "file"),  # Shape IDs
+        "pic": ("id", "file"),  # Picture IDs
+        "grpsp": ("id", "file"),  # Group shape IDs
+    }
+
+    # Mapping of element names to expected relationship types
+    # Subclasses should override this with format-specific mappings
+    ELEMENT_RELATIONSHIP_TYPES = {}
+
+    # Unified schema mappings for all Office document types
+    SCHEMA_MAPPINGS = {
+        # Document type specific schemas
+        "word": "ISO-IEC29500-4_2016/wml.xsd",  # Word documents
+        "ppt": "ISO-IEC29500-4_2016/pml.xsd",  # PowerPoint presentations
+        "xl": "ISO-IEC29500-4_2016/sml.xsd",  # Excel spreadsheets
+        # Common file types
+        "[Content_Types].xml": "ecma/fouth-edition/opc-contentTypes.xsd",
+        "app.xml": "ISO-IEC29500-4_2016/shared-documentPropertiesExtended.xsd",
+        "core.xml": "ecma/fouth-edition/opc-coreProperties.xsd",
+        "custom.xml": "ISO-IEC29500-4_2016/shared-documentPropertiesCustom.xsd",
+        ".rels": "ecma/fouth-edition/opc-relationships.xsd",
+        # Word-specific files
+        "people.xml": "microsoft/wml-2012.xsd",
+        "commentsIds.xml": "microsoft/wml-cid-2016.xsd",
+        "commentsExtensible.xml": "microsoft/wml-cex-2018.xsd",
+        "commentsExtended.xml": "microsoft/wml-2012.xsd",
+        # Chart files (common across document types)
+        "chart": "ISO-IEC29500-4_2016/dml-chart.xsd",
+        # Theme files (common across document types)
+        "theme": "ISO-IEC29500-4_2016/dml-main.xsd",
+        # Drawing and media files
+        "drawing": "ISO-IEC29500-4_2016/dml-main.xsd",
+    }
+
+    # Unified namespace constants
+    MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+    XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+    # Common OOXML namespaces used across validators
+    PACKAGE_RELATIONSHIPS_NAMESPACE = (
+        "http://schemas.openxmlformats.org/package/2006/relationships"
+    )
+    OFFICE_RELATIONSHIPS_NAMESPACE = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    )
+    CONTENT_TYPES_NAMESPACE = (
+        "http://schemas.openxmlformats.org/package/2006/content-types"
+    )
+
+    # Clark-notation names used by the streaming checks
+    ALTERNATE_CONTENT_TAG = f"{{{MC_NAMESPACE}}}AlternateContent"
+    RELATIONSHIP_ID_ATTRIBUTE = f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+
+    # Folders where we should clean ignorable namespaces
+    MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
+
+    # All allowed OOXML namespaces (superset of all document types)
+    OOXML_NAMESPACES = {
+        "http://schemas.openxmlformats.org/officeDocument/2006/math",
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+        "http://schemas.openxmlformats.org/schemaLibrary/2006/main",
+        "http://schemas.openxmlformats.org/drawingml/2006/main",
+        "http://schemas.openxmlformats.org/drawingml/2006/chart",
+        "http://schemas.openxmlformats.org/drawingml/2006/chartDrawing",
+        "http://schemas.openxmlformats.org/drawingml/2006/diagram",
+        "http://schemas.openxmlformats.org/drawingml/2006/picture",
+        "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing",
+        "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
+        "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+        "http://schemas.openxmlformats.org/presentationml/2006/main",
+        "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+        "http://schemas.openxmlformats.org/officeDocument/2006/sharedTypes",
+        "http://www.w3.org/XML/1998/namespace",
+    }
+
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        changed_parts=None,
+        executor=None,
+        lazy_parts=None,
+    ):
+        """
+        Args:
+            unpacked_dir: Path to unpacked Office document directory
+            original_file: Path to original file (.docx/.pptx/.xlsx)
+            verbose: Enable verbose output
+            jobs: Number of worker processes for per-part XSD validation
+                  (default: 1, validate serially in this process)
+            changed_parts: Optional paths relative to unpacked_dir (e.g.
+                  "word/document.xml") that changed since the original. When
+                  given, per-file checks only look at these parts; cross-part
+                  checks still see every part. None checks everything.
+            executor: Optional ProcessPoolExecutor shared with other
+                  validators (e.g. across a batch of documents). When given,
+                  per-part XSD validation runs on it and jobs is ignored.
+            lazy_parts: Optional paths relative to unpacked_dir of parts that
+                  belong to the document but are kept elsewhere, unchanged.
+                  They count as present for reference checks but are not
+                  validated. Parts an `unpack --only` left in the original
+                  file are added from the directory's source record.
+        """
+        self.unpacked_dir = Path(unpacked_dir).resolve()
+        self.original_file = Path(original_file)
+        self.verbose = verbose
+        self.jobs = jobs
+        self.executor = executor
+
+        # Set schemas directory
+        self.schemas_dir = Path(__file__).parent.parent / "schemas"
+
+        # Get all XML and .rels files
+        self.xml_files = self._find_xml_files()
+
+        if not self.xml_files:
+            print(f"Warning: No XML files found in {self.unpacked_dir}")
+
+        # Parsed trees shared by all checks: path -> (mtime_ns, tree or parse error)
+        self._xml_cache = {}
+        # Per-file data used by cross-part checks: (path, name) -> (mtime_ns, data)
+        self._index_cache = {}
+        # Lookup tables filled while streaming, keyed by Clark-notation name
+        self._id_requirements = {}  # tag -> (local tag, attribute, scope) or None
+        self._local_names = {}  # tag or attribute -> local name
+        self._expected_types = {}  # local tag -> expected relationship type
+
+        self.changed_parts = self._normalize_parts(changed_parts)
+        self._given_lazy_parts = self._normalize_parts(lazy_parts or ())
+        self.lazy_parts = self._find_lazy_parts()
+
+        # Structured result of each check run, see results.recorded_check
+        self.results = []
+
+    def validate(self):
+        """Run all validation checks and return True if all pass."""
+        raise NotImplementedError("Subclasses must implement the validate method")
+
+    def refresh(self, changed_parts=None):
+        """Prepare the validator to validate the same directory again.
+
+        Re-scans the unpacked directory for added or removed parts. Cached
+        trees and indexes are kept for unchanged parts and dropped for the
+        changed ones, so a later validate() only redoes work for those.
+
+        Args:
+            changed_parts: Paths that changed since the last validation.
+                  None drops all caches and checks every part.
+        """
+        self.xml_files = self._find_xml_files()
+        self.changed_parts = self._normalize_parts(changed_parts)
+        self.lazy_parts = self._find_lazy_parts()
+        self.results = []
+
+        if self.changed_parts is None:
+            self._xml_cache.clear()
+            self._index_cache.clear()
+            return
+
+        changed_paths = {str(self.unpacked_dir / part) for part in self.changed_parts}
+        for key in [k for k in self._xml_cache if k in changed_paths]:
+            del self._xml_cache[key]
+        for key in [k for k in self._index_cache if k[0] in changed_paths]:
+            del self._index_cache[key]
+
+    def _find_xml_files(self):
+        """Return all XML and .rels files in the unpacked directory."""
+        patterns = ["*.xml", "*.rels"]
+        return [f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)]
+
+    def _find_lazy_parts(self):
+        """Return the lazy parts that are still missing from the unpacked directory."""
+        parts = set(self._given_lazy_parts)
+        lazy = read_lazy_parts(self.unpacked_dir)
+        if lazy is not None:
+            parts.update(lazy[1])
+        return {part for part in parts if not (self.unpacked_dir / part).exists()}
+
+    def _lazy_paths(self):
+        """Return the resolved paths the lazy parts would have if unpacked."""
+        return {(self.unpacked_dir / part).resolve() for part in self.lazy_parts}
+
+    def _normalize_parts(self, parts):
+        """Convert part paths to a set of POSIX paths relative to unpacked_dir."""
+        if parts is None:
+            return None
+        normalized = set()
+        for part in parts:
+            part = Path(part)
+            if part.is_absolute():
+                part = part.resolve().relative_to(self.unpacked_dir)
+            normalized.add(part.as_posix())
+        return normalized
+
+    def _files_to_check(self):
+        """Return the files per-file checks should look at (the changed ones, if known)."""
+        if self.changed_parts is None:
+            return self.xml_files
+        return [
+            f
+            for f in self.xml_files
+            if f.relative_to(self.unpacked_dir).as_posix() in self.changed_parts
+        ]
+
+    def _part_error(self, path, message, line=None):
+        """Return an error record for a file inside the unpacked directory."""
+        return check_error(Path(path).relative_to(self.unpacked_dir), message, line)
+
+    def _get_file_index(self, xml_file, name, build):
+        """Return data derived from one file, calling build(xml_file) only when it changed.
+
+        Cross-part checks keep their per-file results here so that repeated
+        validations only rebuild the parts that were edited.
+        """
+        xml_file = Path(xml_file)
+        key = (str(xml_file), name)
+        mtime = xml_file.stat().st_mtime_ns
+
+        cached = self._index_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = self._index_cache[key] = (mtime, build(xml_file))
+        return cached[1]
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file once and return the cached tree.
+
+        Entries are keyed by path and modification time, so a file rewritten
+        on disk is parsed again. Parse errors are cached and re-raised. The
+        tree is shared by all checks, which must not modify it.
+
+        Args:
+            xml_file: Path to the XML file
+
+        Returns:
+            lxml.etree._ElementTree: The parsed document
+        """
+        xml_file = Path(xml_file)
+        key = str(xml_file)
+        mtime = xml_file.stat().st_mtime_ns
+
+        cached = self._xml_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            try:
+                tree = lxml.etree.parse(key)
+            except lxml.etree.XMLSyntaxError as e:
+                tree = e
+            cached = self._xml_cache[key] = (mtime, tree)
+
+        tree = cached[1]
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    @recorded_check
+    def validate_xml(self):
+        """Validate that all XML files are well-formed."""
+        errors = []
+
+        for xml_file in self._files_to_check():
+            try:
+                # Try to parse the XML file
+                self._parse_xml(xml_file)
+            except lxml.etree.XMLSyntaxError as e:
+                errors.append(self._part_error(xml_file, e.msg, e.lineno))
+            except Exception as e:
+                errors.append(
+                    self._part_error(xml_file, f"Unexpected error: {str(e)}")
+                )
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} XML violations:")
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - All XML files are well-formed")
+        return errors
+
+    @recorded_check
+    def validate_namespaces(self):
+        """Validate that namespace prefixes in Ignorable attributes are declared."""
+        errors = []
+
+        for xml_file in self._files_to_check():
+            try:
+                root = self._parse_xml(xml_file).getroot()
+                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+                for attr_val in [
+                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
+                ]:
+                    undeclared = set(attr_val.split()) - declared
+                    errors.extend(
+                        self._part_error(
+                            xml_file, f"Namespace '{ns}' in Ignorable but not declared"
+                        )
+                        for ns in undeclared
+                    )
+            except lxml.etree.XMLSyntaxError:
+                continue
+
+        if errors:
+            print(f"FAILED - {len(errors)} namespace issues:")
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - All namespace prefixes properly declared")
+        return errors
+
+    @recorded_check
+    def validate_unique_ids(self):
+        """Validate that specific IDs are unique according to OOXML requirements."""
+        errors = []
+        global_ids = {}  # Track globally unique IDs across all files
+
+        for xml_file in self.xml_files:
+            try:
+                file_ids = {}  # Track IDs that must be unique within this file
+
+                for tag, attr_name, scope, id_value, line in self._get_file_index(
+                    xml_file, "unique_ids", self._collect_unique_ids
+                ):
+                    if scope == "global":
+                        # Check global uniqueness
+                        if id_value in global_ids:
+                            prev_file, prev_line, prev_tag = global_ids[id_value]
+                            errors.append(
+                                self._part_error(
+                                    xml_file,
+                                    f"Global ID '{id_value}' in <{tag}> "
+                                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>",
+                                    line,
+                                )
+                            )
+                        else:
+                            global_ids[id_value] = (
+                                xml_file.relative_to(self.unpacked_dir),
+                                line,
+                                tag,
+                            )
+                    elif scope == "file":
+                        # Check file-level uniqueness
+                        key = (tag, attr_name)
+                        if key not in file_ids:
+                            file_ids[key] = {}
+
+                        if id_value in file_ids[key]:
+                            prev_line = file_ids[key][id_value]
+                            errors.append(
+                                self._part_error(
+                                    xml_file,
+                                    f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                    f"(first occurrence at line {prev_line})",
+                                    line,
+                                )
+                            )
+                        else:
+                            file_ids[key][id_value] = line
+
+            except (lxml.etree.XMLSyntaxError, Exception) as e:
+                errors.append(self._part_error(xml_file, f"Error: {e}"))
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - All required IDs are unique")
+        return errors
+
+    def _collect_unique_ids(self, xml_file):
+        """Collect (tag, attribute, scope, id, line) for IDs covered by UNIQUE_ID_REQUIREMENTS.
+
+        Streams the file with iterparse and frees finished elements, so memory
+        stays flat for very large parts. IDs inside mc:AlternateContent are
+        ignored.
+        """
+        ids = []
+        alternate_content_depth = 0
+
+        for event, elem in lxml.etree.iterparse(
+            str(xml_file), events=("start", "end")
+        ):
+            if event == "end":
+                if elem.tag == self.ALTERNATE_CONTENT_TAG:
+                    alternate_content_depth -= 1
+                self._release_element(elem)
+                continue
+
+            if elem.tag == self.ALTERNATE_CONTENT_TAG:
+                alternate_content_depth += 1
+                continue
+            if alternate_content_depth:
+                continue
+
+            # Check if this element type has ID uniqueness requirements
+            requirement = self._get_id_requirement(elem.tag)
+            if requirement is None:
+                continue
+            tag, attr_name, scope = requirement
+
+            # Look for the specified attribute
+            for attr, value in elem.attrib.items():
+                if self._get_local_name(attr).lower() == attr_name:
+                    ids.append((tag, attr_name, scope, value, elem.sourceline))
+                    break
+
+        return ids
+
+    def _get_id_requirement(self, tag):
+        """Return (local tag, attribute, scope) from UNIQUE_ID_REQUIREMENTS for a tag, or None."""
+        if tag not in self._id_requirements:
+            local_tag = self._get_local_name(tag).lower()
+            requirement = self.UNIQUE_ID_REQUIREMENTS.get(local_tag)
+            self._id_requirements[tag] = (
+                (local_tag, *requirement) if requirement else None
+            )
+        return self._id_requirements[tag]
+
+    def _get_local_name(self, name):
+        """Return the local part of a Clark-notation name ("{ns}tag" -> "tag")."""
+        local_name = self._local_names.get(name)
+        if local_name is None:
+            local_name = name.split("}")[-1] if "}" in name else name
+            self._local_names[name] = local_name
+        return local_name
+
+    @staticmethod
+    def _release_element(elem):
+        """Free a finished iterparse element and its already processed siblings."""
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    @recorded_check
+    def validate_file_references(self):
+        """
+        Validate that all .rels files properly reference files and that all files are referenced.
+        """
+        errors = []
+
+        # Find all .rels files
+        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+
+        if not rels_files:
+            if self.verbose:
+                print("PASSED - No .rels files found")
+            return errors
+
+        # Get all files in the unpacked directory (excluding reference files),
+        # and the lazy parts kept elsewhere
+        lazy_paths = self._lazy_paths()
+        all_files = []
+        for file_path in [*self.unpacked_dir.rglob("*"), *lazy_paths]:
+            if (
+                (file_path.is_file() or file_path in lazy_paths)
+                and file_path.name not in ("[Content_Types].xml", LAZY_SOURCE_FILE)
+                and not file_path.name.endswith(".rels")
+            ):  # This file is not referenced by .rels
+                all_files.append(file_path.resolve())
+
+        # Track all files that are referenced by any .rels file
+        all_referenced_files = set()
+
+        if self.verbose:
+            print(
+                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+            )
+
+        # Check each .rels file
+        for rels_file in rels_files:
+            try:
+                # Parse relationships file
+                rels_root = self._parse_xml(rels_file).getroot()
+
+                # Get the directory where this .rels file is located
+                rels_dir = rels_file.parent
+
+                # Find all relationships and their targets
+                referenced_files = set()
+                broken_refs = []
+
+                for rel in rels_root.findall(
+                    ".//ns:Relationship",
+                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
+                ):
+                    target = rel.get("Target")
+                    if target and not target.startswith(
+                        ("http", "mailto:")
+                    ):  # Skip external URLs
+                        # Resolve the target path relative to the .rels file location
+                        if rels_file.name == ".rels":
+                            # Root .rels file - targets are relative to unpacked_dir
+                            target_path = self.unpacked_dir / target
+                        else:
+                            # Other .rels files - targets are relative to their parent's parent
+                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
+                            base_dir = rels_dir.parent
+                            target_path = base_dir / target
+
+                        # Normalize the path and check if it exists
+                        try:
+                            target_path = target_path.resolve()
+                            if target_path.is_file() or target_path in lazy_paths:
+                                referenced_files.add(target_path)
+                                all_referenced_files.add(target_path)
+                            else:
+                                broken_refs.append((target, rel.sourceline))
+                        except (OSError, ValueError):
+                            broken_refs.append((target, rel.sourceline))
+
+                # Report broken references
+                for broken_ref, line_num in broken_refs:
+                    errors.append(
+                        self._part_error(
+                            rels_file, f"Broken reference to {broken_ref}", line_num
+                        )
+                    )
+
+            except Exception as e:
+                errors.append(self._part_error(rels_file, f"Error: {e}"))
+
+        # Check for unreferenced files (files that exist but are not referenced anywhere)
+        unreferenced_files = set(all_files) - all_referenced_files
+
+        for unref_file in sorted(unreferenced_files):
+            errors.append(self._part_error(unref_file, "Unreferenced file"))
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} relationship validation errors:")
+            print_errors(errors)
+            print(
+                "CRITICAL: These errors will cause the document to appear corrupt. "
+                + "Broken references MUST be fixed, "
+                + "and unreferenced files MUST be referenced or removed."
+            )
+        elif self.verbose:
+            print(
+                "PASSED - All references are valid and all files are properly referenced"
+            )
+        return errors
+
+    @recorded_check
+    def validate_all_relationship_ids(self):
+        """
+        Validate that all r:id attributes in XML files reference existing IDs
+        in their corresponding .rels files, and optionally validate relationship types.
+        """
+        errors = []
+
+        # Process each XML file that might contain r:id references
+        for xml_file in self.xml_files:
+            # Skip .rels files themselves
+            if xml_file.suffix == ".rels":
+                continue
+
+            # Determine the corresponding .rels file
+            # For dir/file.xml, it's dir/_rels/file.xml.rels
+            rels_dir = xml_file.parent / "_rels"
+            rels_file = rels_dir / f"{xml_file.name}.rels"
+
+            # Skip if there's no corresponding .rels file (that's okay)
+            if not rels_file.exists():
+                continue
+
+            try:
+                # Get valid relationship IDs and their types from the .rels file
+                rid_to_type = {}
+
+                for rid, type_name, line in self._get_file_index(
+                    rels_file, "relationships", self._collect_relationships
+                ):
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        errors.append(
+                            self._part_error(
+                                rels_file,
+                                f"Duplicate relationship ID '{rid}' (IDs must be unique)",
+                                line,
+                            )
+                        )
+                    rid_to_type[rid] = type_name
+
+                # Check all r:id references in the XML file
+                for elem_name, rid_attr, line in self._get_file_index(
+                    xml_file, "relationship_refs", self._collect_relationship_refs
+                ):
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            self._part_error(
+                                xml_file,
+                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})",
+                                line,
+                            )
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(elem_name)
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    self._part_error(
+                                        xml_file,
+                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                        f"but should point to a '{expected_type}' relationship",
+                                        line,
+                                    )
+                                )
+
+            except Exception as e:
+                errors.append(self._part_error(xml_file, f"Error: {e}"))
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
+            print_errors(errors)
+            print("\nThese ID mismatches will cause the document to appear corrupt!")
+        elif self.verbose:
+            print("PASSED - All relationship ID references are valid")
+        return errors
+
+    def _collect_relationships(self, rels_file):
+        """Collect (id, type name, line) for each Relationship in a .rels file."""
+        rels_root = self._parse_xml(rels_file).getroot()
+        relationships = []
+
+        for rel in rels_root.findall(
+            f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            rid = rel.get("Id")
+            rel_type = rel.get("Type", "")
+            if rid:
+                # Extract just the type name from the full URL
+                type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                relationships.append((rid, type_name, rel.sourceline))
+
+        return relationships
+
+    def _collect_relationship_refs(self, xml_file):
+        """Collect (element name, r:id, line) for each r:id attribute in an XML file.
+
+        Streams the file with iterparse and frees finished elements.
+        """
+        refs = []
+
+        for event, elem in lxml.etree.iterparse(
+            str(xml_file), events=("start", "end")
+        ):
+            if event == "end":
+                self._release_element(elem)
+                continue
+
+            # Check for r:id attribute (relationship ID)
+            rid_attr = elem.get(self.RELATIONSHIP_ID_ATTRIBUTE)
+            if rid_attr:
+                refs.append((self._get_local_name(elem.tag), rid_attr, elem.sourceline))
+
+        return refs
+
+    def _get_expected_relationship_type(self, element_name):
+        """
+        Get the expected relationship type for an element.
+        First checks the explicit mapping, then tries pattern detection.
+        Results are memoized per element name.
+        """
+        if element_name not in self._expected_types:
+            self._expected_types[element_name] = (
+                self._detect_expected_relationship_type(element_name)
+            )
+        return self._expected_types[element_name]
+
+    def _detect_expected_relationship_type(self, element_name):
+        """Derive the expected relationship type for an element name."""
+        # Normalize element name to lowercase
+        elem_lower = element_name.lower()
+
+        # Check explicit mapping first
+        if elem_lower in self.ELEMENT_RELATIONSHIP_TYPES:
+            return self.ELEMENT_RELATIONSHIP_TYPES[elem_lower]
+
+        # Try pattern detection for common patterns
+        # Pattern 1: Elements ending in "Id" often expect a relationship of the prefix type
+        if elem_lower.endswith("id") and len(elem_lower) > 2:
+            # e.g., "sldId" -> "sld", "sldMasterId" -> "sldMaster"
+            prefix = elem_lower[:-2]  # Remove "id"
+            # Check if this might be a compound like "sldMasterId"
+            if prefix.endswith("master"):
+                return prefix.lower()
+            elif prefix.endswith("layout"):
+                return prefix.lower()
+            else:
+                # Simple case like "sldId" -> "slide"
+                # Common transformations
+                if prefix == "sld":
+                    return "slide"
+                return prefix.lower()
+
+        # Pattern 2: Elements ending in "Reference" expect a relationship of the prefix type
+        if elem_lower.endswith("reference") and len(elem_lower) > 9:
+            prefix = elem_lower[:-9]  # Remove "reference"
+            return prefix.lower()
+
+        return None
+
+    @recorded_check
+    def validate_content_types(self):
+        """Validate that all content files are properly declared in [Content_Types].xml."""
+        errors = []
+
+        # Find [Content_Types].xml file
+        content_types_file = self.unpacked_dir / "[Content_Types].xml"
+        if not content_types_file.exists():
+            print("FAILED - [Content_Types].xml file not found")
+            return [check_error(content_types_file.name, "File not found")]
+
+        try:
+            # Parse and get all declared parts and extensions
+            root = self._parse_xml(content_types_file).getroot()
+            declared_parts = set()
+            declared_extensions = set()
+
+            # Get Override declarations (specific files)
+            for override in root.findall(
+                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
+            ):
+                part_name = override.get("PartName")
+                if part_name is not None:
+                    declared_parts.add(part_name.lstrip("/"))
+
+            # Get Default declarations (by extension)
+            for default in root.findall(
+                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
+            ):
+                extension = default.get("Extension")
+                if extension is not None:
+                    declared_extensions.add(extension.lower())
+
+            # Root elements that require content type declaration
+            declarable_roots = {
+                "sld",
+                "sldLayout",
+                "sldMaster",
+                "presentation",  # PowerPoint
+                "document",  # Word
+                "workbook",
+                "worksheet",  # Excel
+                "theme",  # Common
+            }
+
+            # Common media file extensions that should be declared
+            media_extensions = {
+                "png": "image/png",
+                "jpg": "image/jpeg",
+                "jpeg": "image/jpeg",
+                "gif": "image/gif",
+                "bmp": "image/bmp",
+                "tiff": "image/tiff",
+                "wmf": "image/x-wmf",
+                "emf": "image/x-emf",
+            }
+
+            # Get all files in the unpacked directory, and the lazy parts
+            all_files = list(self.unpacked_dir.rglob("*"))
+            all_files = [f for f in all_files if f.is_file()]
+            all_files.extend(sorted(self._lazy_paths()))
+
+            # Check all XML files for Override declarations
+            for xml_file in self.xml_files:
+                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
+                    "\\", "/"
+                )
+
+                # Skip non-content files
+                if any(
+                    skip in path_str
+                    for skip in [".rels", "[Content_Types]", "docProps/", "_rels/"]
+                ):
+                    continue
+
+                try:
+                    root_tag = self._parse_xml(xml_file).getroot().tag
+                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
+                    if root_name in declarable_roots and path_str not in declared_parts:
+                        errors.append(
+                            check_error(
+                                path_str,
+                                f"File with <{root_name}> root not declared in [Content_Types].xml",
+                            )
+                        )
+
+                except Exception:
+                    continue  # Skip unparseable files
+
+            # Check all non-XML files for Default extension declarations
+            for file_path in all_files:
+                # Skip XML files and metadata files (already checked above)
+                if file_path.suffix.lower() in {".xml", ".rels"}:
+                    continue
+                if file_path.name == "[Content_Types].xml":
+                    continue
+                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                    continue
+
+                extension = file_path.suffix.lstrip(".").lower()
+                if extension and extension not in declared_extensions:
+                    # Check if it's a known media extension that should be declared
+                    if extension in media_extensions:
+                        errors.append(
+                            self._part_error(
+                                file_path,
+                                f'File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>',
+                            )
+                        )
+
+        except Exception as e:
+            errors.append(self._part_error(content_types_file, f"Error: {e}"))
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} content type declaration errors:")
+            print_errors(errors)
+        elif self.verbose:
+            print(
+                "PASSED - All content files are properly declared in [Content_Types].xml"
+            )
+        return errors
+
+    def validate_file_against_xsd(self, xml_file, verbose=False):
+        """Validate a single XML file against XSD schema, comparing with original.
+
+        Args:
+            xml_file: Path to XML file to validate
+            verbose: Enable verbose output
+
+        Returns:
+            tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
+        """
+        # Resolve both paths to handle symlinks
+        xml_file = Path(xml_file).resolve()
+        unpacked_dir = self.unpacked_dir.resolve()
+
+        # Validate current file
+        is_valid, current_errors = self._validate_single_file_xsd(
+            xml_file, unpacked_dir
+        )
+
+        if is_valid is None:
+            return None, set()  # Skipped
+        elif is_valid:
+            return True, set()  # Valid, no errors
+
+        # Get errors from original file for this specific file
+        original_errors = self._get_original_file_errors(xml_file)
+
+        # Compare with original (both are guaranteed to be sets here)
+        assert current_errors is not None
+        new_errors = current_errors - original_errors
+
+        if new_errors:
+            if verbose:
+                relative_path = xml_file.relative_to(unpacked_dir)
+                print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
+                for error in sorted(new_errors)[:3]:
+                    truncated = error[:250] + "..." if len(error) > 250 else error
+                    print(f"  - {truncated}")
+            return False, new_errors
+        else:
+            # All errors existed in original
+            if verbose:
+                print(
+                    f"PASSED - No new errors (original had {len(current_errors)} errors)"
+                )
+            return True, set()
+
+    @recorded_check
+    def validate_against_xsd(self):
+        """Validate XML files against XSD schemas, showing only new errors compared to original."""
+        errors = []
+        original_error_count = 0
+        valid_count = 0
+        skipped_count = 0
+
+        xml_files = self._files_to_check()
+        for xml_file, (is_valid, new_file_errors) in zip(
+            xml_files, self._map_validate_file_against_xsd(xml_files)
+        ):
+            if is_valid is None:
+                skipped_count += 1
+                continue
+            elif is_valid and not new_file_errors:
+                valid_count += 1
+                continue
+            elif is_valid:
+                # Had errors but all existed in original
+                original_error_count += 1
+                valid_count += 1
+                continue
+
+            # Has new errors
+            errors.extend(
+                self._part_error(xml_file, error) for error in sorted(new_file_errors)
+            )
+
+        # Group the new errors by part for the report
+        errors_by_part = {}
+        for error in errors:
+            errors_by_part.setdefault(error["part"], []).append(error["message"])
+
+        # Print summary
+        if self.verbose:
+            print(f"Validated {len(xml_files)} files:")
+            print(f"  - Valid: {valid_count}")
+            print(f"  - Skipped (no schema): {skipped_count}")
+            if original_error_count:
+                print(f"  - With original errors (ignored): {original_error_count}")
+            print(f"  - With NEW errors: {len(errors_by_part)}")
+
+        if errors:
+            print("\nFAILED - Found NEW validation errors:")
+            for part, messages in errors_by_part.items():
+                print(f"  {part}: {len(messages)} new error(s)")
+                for message in messages[:3]:  # Show first 3 errors
+                    print(
+                        f"    - {message[:250]}..."
+                        if len(message) > 250
+                        else f"    - {message}"
+                    )
+        elif self.verbose:
+            print("\nPASSED - No new XSD validation errors introduced")
+        return errors
+
+    def _map_validate_file_against_xsd(self, xml_files):
+        """Yield validate_file_against_xsd results in xml_files order.
+
+        With a shared executor or jobs > 1 the files are spread over a process
+        pool; results are still yielded in file order so output matches a
+        serial run.
+        """
+        validate = functools.partial(
+            _validate_file_against_xsd_in_worker,
+            type(self),
+            self.unpacked_dir,
+            self.original_file,
+        )
+
+        if self.executor is not None:
+            yield from self.executor.map(validate, xml_files)
+            return
+
+        if self.jobs <= 1 or len(xml_files) < 2:
+            for xml_file in xml_files:
+                yield self.validate_file_against_xsd(xml_file, verbose=False)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(xml_files))
+        ) as executor:
+            yield from executor.map(validate, xml_files)
+
+    def _get_schema_path(self, xml_file):
+        """Determine the appropriate schema path for an XML file."""
+        # Check exact filename match
+        if xml_file.name in self.SCHEMA_MAPPINGS:
+            return self.schemas_dir / self.SCHEMA_MAPPINGS[xml_file.name]
+
+        # Check .rels files
+        if xml_file.suffix == ".rels":
+            return self.schemas_dir / self.SCHEMA_MAPPINGS[".rels"]
+
+        # Check chart files
+        if "charts/" in str(xml_file) and xml_file.name.startswith("chart"):
+            return self.schemas_dir / self.SCHEMA_MAPPINGS["chart"]
+
+        # Check theme files
+        if "theme/" in str(xml_file) and xml_file.name.startswith("theme"):
+            return self.schemas_dir / self.SCHEMA_MAPPINGS["theme"]
+
+        # Check if file is in a main content folder and use appropriate schema
+        if xml_file.parent.name in self.MAIN_CONTENT_FOLDERS:
+            return self.schemas_dir / self.SCHEMA_MAPPINGS[xml_file.parent.name]
+
+        return None
+
+    def _prepare_for_xsd(self, xml_doc, clean_namespaces):
+        """Return a copy of a tree ready for XSD validation.
+
+        The tree is copied once and then cleaned in a single traversal:
+        template tags ({{ ... }}) are stripped from text outside w:t elements,
+        mc:Ignorable is dropped from the root and, if clean_namespaces is set,
+        attributes and elements outside the allowed namespaces are removed.
+        """
+        root = copy.deepcopy(xml_doc.getroot())
+
+        ignorable_attr = f"{{{self.MC_NAMESPACE}}}Ignorable"
+        if ignorable_attr in root.attrib:
+            del root.attrib[ignorable_attr]
+
+        self._clean_element_for_xsd(root, clean_namespaces)
+
+        stack = [root]
+        while stack:
+            parent = stack.pop()
+            elements_to_remove = []
+
+            for elem in parent:
+                # Skip non-element nodes (comments, processing instructions, etc.)
+                tag = elem.tag
+                if not isinstance(tag, str):
+                    continue
+
+                # Foreign elements are dropped whole, so their subtree is not visited
+                if (
+                    clean_namespaces
+                    and tag[0] == "{"
+                    and tag[1 : tag.index("}")] not in self.OOXML_NAMESPACES
+                ):
+                    elements_to_remove.append(elem)
+                    continue
+
+                self._clean_element_for_xsd(elem, clean_namespaces)
+                stack.append(elem)
+
+            for elem in elements_to_remove:
+                parent.remove(elem)
+
+        return lxml.etree.ElementTree(root)
+
+    def _clean_element_for_xsd(self, elem, clean_namespaces):
+        """Strip template tags and foreign attributes from a single element."""
+        # Template tags inside w:t are content and are left alone
+        tag = elem.tag
+        if not (tag.endswith("}t") or tag == "t"):
+            if elem.text and "{{" in elem.text:
+                elem.text = TEMPLATE_TAG_PATTERN.sub("", elem.text)
+            if elem.tail and "{{" in elem.tail:
+                elem.tail = TEMPLATE_TAG_PATTERN.sub("", elem.tail)
+
+        if clean_namespaces:
+            attrs_to_remove = [
+                attr
+                for attr in elem.attrib
+                if attr[0] == "{"
+                and attr[1 : attr.index("}")] not in self.OOXML_NAMESPACES
+            ]
+            for attr in attrs_to_remove:
+                del elem.attrib[attr]
+
+    def _load_schema(self, schema_path):
+        """Return the compiled XSD schema for a path, compiling it on first use.
+
+        Compiling the large OOXML schemas dominates validation time, so each
+        schema is compiled once per process and reused for every file.
+        """
+        key = str(schema_path)
+        schema = _SCHEMA_CACHE.get(key)
+        if schema is None:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+                schema = _SCHEMA_CACHE[key] = lxml.etree.XMLSchema(xsd_doc)
+        return schema
+
+    def _validate_single_file_xsd(self, xml_file, base_path, xml_doc=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        Args:
+            xml_file: Path to the XML file, used to pick the schema
+            base_path: Directory that xml_file is relative to
+            xml_doc: Already parsed tree to validate instead of reading xml_file
+        """
+        schema_path = self._get_schema_path(xml_file)
+        if not schema_path:
+            return None, None  # Skip file
+
+        try:
+            # Load schema
+            schema = self._load_schema(schema_path)
+
+            # Load XML (preprocessing works on a copy)
+            if xml_doc is None:
+                xml_doc = self._parse_xml(xml_file)
+
+            # Strip template tags, mc:Ignorable and (in main content parts)
+            # foreign namespaces from a single copy of the tree
+            relative_path = xml_file.relative_to(base_path)
+            xml_doc = self._prepare_for_xsd(
+                xml_doc,
+                clean_namespaces=bool(relative_path.parts)
+                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS,
+            )
+
+            # Validate
+            if schema.validate(xml_doc):
+                return True, set()
+            else:
+                errors = set()
+                for error in schema.error_log:
+                    # Store normalized error message (without line numbers for comparison)
+                    errors.add(error.message)
+                return False, errors
+
+        except Exception as e:
+            return False, {str(e)}
+
+    def _get_original_file_errors(self, xml_file):
+        """Get XSD validation errors from a single file in the original document.
+
+        The original part is read straight from the archive and its errors are
+        memoized on the shared OriginalPackage.
+
+        Args:
+            xml_file: Path to the XML file in unpacked_dir to check
+
+        Returns:
+            set: Set of error messages from the original file
+        """
+        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
+        xml_file = Path(xml_file).resolve()
+        unpacked_dir = self.unpacked_dir.resolve()
+        relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = relative_path.as_posix()
+
+        original = OriginalPackage.open(self.original_file)
+        if not original.has(part_name):
+            # File didn't exist in original, so no original errors
+            return set()
+
+        def compute():
+            try:
+                xml_doc = original.parse(part_name)
+            except Exception as e:
+                return {str(e)}
+            # Validate the specific file in original
+            is_valid, errors = self._validate_single_file_xsd(
+                relative_path, Path(), xml_doc=xml_doc
+            )
+            return errors if errors else set()
+
+        return original.xsd_errors(part_name, compute)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -3,12 +3,12 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .original import OriginalPackage
+from .results import print_errors, recorded_check
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -69,19 +69,20 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @recorded_check
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._files_to_check():
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -102,25 +103,24 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                                     else repr(text)
                                 )
                                 errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                                    self._part_error(
+                                        xml_file,
+                                        f"w:t element with whitespace missing xml:space='preserve': {text_preview}",
+                                        elem.sourceline,
+                                    )
                                 )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(xml_file, f"Error: {e}"))
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All whitespace is properly preserved")
-            return True
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - All whitespace is properly preserved")
+        return errors
 
+    @recorded_check
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
@@ -128,13 +128,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._files_to_check():
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -151,24 +151,22 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                             else repr(t_elem.text)
                         )
                         errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                            self._part_error(
+                                xml_file,
+                                f"<w:t> found within <w:del>: {text_preview}",
+                                t_elem.sourceline,
+                            )
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(xml_file, f"Error: {e}"))
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:t elements found within w:del elements")
-            return True
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - No w:t elements found within w:del elements")
+        return errors
 
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
@@ -180,7 +178,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,25 +192,20 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            # Parse document.xml straight from the original archive
+            original = OriginalPackage.open(self.original_file)
+            root = original.parse("word/document.xml").getroot()
 
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
 
         return count
 
+    @recorded_check
     def validate_insertions(self):
         """
         Validate that w:delText elements are not within w:ins elements.
@@ -220,12 +213,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self._files_to_check():
             if xml_file.name != "document.xml":
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -241,27 +234,28 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                         else repr(elem.text or "")
                     )
                     errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                        self._part_error(
+                            xml_file,
+                            f"<w:delText> within <w:ins>: {text_preview}",
+                            elem.sourceline,
+                        )
                     )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(xml_file, f"Error: {e}"))
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:delText elements within w:ins elements")
-            return True
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - No w:delText elements within w:ins elements")
+        return errors
 
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
+        if "word/document.xml" in self.lazy_parts:
+            return  # Not unpacked, so unchanged
+
         original_count = self.count_paragraphs_in_original()
         new_count = self.count_paragraphs_in_unpacked()
 
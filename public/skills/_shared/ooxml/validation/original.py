@@ -0,0 +1,82 @@
+"""
+Read-only view of the original Office file used as the validation baseline.
+"""
+
+import io
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+# Shared packages keyed by resolved path: path -> ((mtime_ns, size), package)
+_PACKAGES = {}
+
+# Packages kept open at once; batch runs over many originals evict the oldest
+_MAX_PACKAGES = 16
+
+
+class OriginalPackage:
+    """Read-only view of an original Office file that never extracts to disk.
+
+    Parts are read straight from the zip archive on first use. Parsed trees
+    and XSD error sets are cached per part, so all validators sharing a
+    package read and validate each original part at most once.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._names = None
+        self._trees = {}
+        self._xsd_errors = {}
+
+    @classmethod
+    def open(cls, path):
+        """Return the shared package for a file, reopening it if the file changed."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = _PACKAGES.pop(str(path), None)
+        if cached is None or cached[0] != signature:
+            cached = (signature, cls(path))
+        _PACKAGES[str(path)] = cached  # Most recently used last
+
+        while len(_PACKAGES) > _MAX_PACKAGES:
+            del _PACKAGES[next(iter(_PACKAGES))]
+        return cached[1]
+
+    def has(self, name):
+        """Check whether the package contains a part (e.g. "word/document.xml")."""
+        if self._names is None:
+            with zipfile.ZipFile(self.path, "r") as zip_ref:
+                self._names = set(zip_ref.namelist())
+        return name in self._names
+
+    def read(self, name):
+        """Return the raw bytes of a part.
+
+        Raises:
+            KeyError: If the package does not contain the part
+        """
+        with zipfile.ZipFile(self.path, "r") as zip_ref:
+            return zip_ref.read(name)
+
+    def parse(self, name):
+        """Return the parsed tree of a part, shared between callers.
+
+        The tree must not be modified; callers that need to change it should
+        work on a copy.
+        """
+        if name not in self._trees:
+            self._trees[name] = lxml.etree.parse(io.BytesIO(self.read(name)))
+        return self._trees[name]
+
+    def xsd_errors(self, name, compute):
+        """Return the XSD error set of a part, calling compute() only the first time."""
+        if name not in self._xsd_errors:
+            self._xsd_errors[name] = compute()
+        return self._xsd_errors[name]
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
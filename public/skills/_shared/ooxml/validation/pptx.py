@@ -5,6 +5,7 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 import re
 
 from .base import BaseSchemaValidator
+from .results import print_errors, recorded_check
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -74,6 +75,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @recorded_check
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
         import lxml.etree
@@ -84,9 +86,9 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
         )
 
-        for xml_file in self.xml_files:
+        for xml_file in self._files_to_check():
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
@@ -99,24 +101,22 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                                 # Validate that it contains only hex characters in the right positions
                                 if not uuid_pattern.match(value):
                                     errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                                        self._part_error(
+                                            xml_file,
+                                            f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                                            elem.sourceline,
+                                        )
                                     )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(xml_file, f"Error: {e}"))
 
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All UUID-like IDs contain valid hex values")
-            return True
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - All UUID-like IDs contain valid hex values")
+        return errors
 
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
@@ -125,6 +125,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         # Check if it's 32 hex-like characters (could include invalid hex chars)
         return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
 
+    @recorded_check
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
         import lxml.etree
@@ -137,25 +138,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not slide_masters:
             if self.verbose:
                 print("PASSED - No slide masters found")
-            return True
+            return errors
 
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
                 if not rels_file.exists():
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        self._part_error(
+                            slide_master,
+                            f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}",
+                        )
                     )
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -177,29 +180,28 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                            self._part_error(
+                                slide_master,
+                                f"sldLayoutId with id='{layout_id}' "
+                                f"references r:id='{r_id}' which is not found in slide layout relationships",
+                                sld_layout_id.sourceline,
+                            )
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(slide_master, f"Error: {e}"))
 
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
-            for error in errors:
-                print(error)
+            print_errors(errors)
             print(
                 "Remove invalid references or add missing slide layouts to the relationships file."
             )
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All slide layout IDs reference valid slide layouts")
-            return True
+        elif self.verbose:
+            print("PASSED - All slide layout IDs reference valid slide layouts")
+        return errors
 
+    @recorded_check
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
         import lxml.etree
@@ -209,7 +211,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -222,24 +224,22 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                 if len(layout_rels) > 1:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        self._part_error(
+                            rels_file, f"has {len(layout_rels)} slideLayout references"
+                        )
                     )
 
             except Exception as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(rels_file, f"Error: {e}"))
 
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All slides have exactly one slideLayout reference")
-            return True
+            print_errors(errors)
+        elif self.verbose:
+            print("PASSED - All slides have exactly one slideLayout reference")
+        return errors
 
+    @recorded_check
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
         import lxml.etree
@@ -253,12 +253,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not slide_rels_files:
             if self.verbose:
                 print("PASSED - No slide relationship files found")
-            return True
+            return errors
 
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
@@ -283,32 +283,29 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                             )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(self._part_error(rels_file, f"Error: {e}"))
 
-        # Check for duplicate references
+        # Check for duplicate references, reported once per referencing slide
         for target, references in notes_slide_references.items():
             if len(references) > 1:
                 slide_names = [ref[0] for ref in references]
-                errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                message = (
+                    f"Notes slide '{target}' is referenced by multiple slides: "
+                    f"{', '.join(slide_names)}"
+                )
+                errors.extend(
+                    self._part_error(rels_file, message) for _, rels_file in references
                 )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
 
         if errors:
             print(
-                f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
+                f"FAILED - Found {len(errors)} notes slide reference validation errors:"
             )
-            for error in errors:
-                print(error)
+            print_errors(errors)
             print("Each slide may optionally have its own slide file.")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All notes slide references are unique")
-            return True
+        elif self.verbose:
+            print("PASSED - All notes slide references are unique")
+        return errors
 
 
 if __name__ == "__main__":
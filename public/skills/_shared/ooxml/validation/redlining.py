@@ -4,9 +4,12 @@ Validator for tracked changes in Word documents.
 
 import subprocess
 import tempfile
-import zipfile
 from pathlib import Path
 
+from ..unpack import read_lazy_parts
+from .original import OriginalPackage
+from .results import check_error, recorded_check
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -19,13 +22,25 @@ class RedliningValidator:
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
 
+        # Structured result of each check run, see results.recorded_check
+        self.results = []
+
+    @recorded_check
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
         if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
-            return False
+            lazy = read_lazy_parts(self.unpacked_dir)
+            if lazy is not None and "word/document.xml" in lazy[1]:
+                # Left in the original by unpack --only, so it has no changes
+                if self.verbose:
+                    print("PASSED - word/document.xml was not unpacked.")
+                return []
+            return self._fail(
+                f"Modified document.xml not found at {modified_file}",
+                "word/document.xml",
+            )
 
         # First, check if there are any tracked changes by Claude to validate
         try:
@@ -54,67 +69,61 @@ class RedliningValidator:
             if not claude_del_elements and not claude_ins_elements:
                 if self.verbose:
                     print("PASSED - No tracked changes by Claude found.")
-                return True
+                return []
 
         except Exception:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        # Read the original document.xml straight from the original docx
+        try:
+            original = OriginalPackage.open(self.original_docx)
+            has_original_document = original.has("word/document.xml")
+        except Exception as e:
+            return self._fail(f"Error unpacking original docx: {e}")
+
+        if not has_original_document:
+            return self._fail(
+                f"Original document.xml not found in {self.original_docx}"
+            )
+
+        # Parse both XML files using xml.etree.ElementTree for redlining validation
+        try:
+            import xml.etree.ElementTree as ET
+
+            modified_tree = ET.parse(modified_file)
+            modified_root = modified_tree.getroot()
+            original_root = ET.fromstring(original.read("word/document.xml"))
+        except ET.ParseError as e:
+            return self._fail(f"Error parsing XML files: {e}")
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            return self._fail(error_message, "word/document.xml")
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return []
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+    def _fail(self, message, part=None):
+        """Print a failure and return it as the check's error records."""
+        error = check_error(part, message)
+        print(f"FAILED - {error['message']}")
+        return [error]
 
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
         error_parts = [
-            "FAILED - Document text doesn't match after removing Claude's tracked changes",
+            "Document text doesn't match after removing Claude's tracked changes",
             "",
             "Likely causes:",
             "  1. Modified text inside another author's <w:ins> or <w:del> tags",
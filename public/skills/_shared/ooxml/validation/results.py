@@ -0,0 +1,80 @@
+"""
+Structured, machine-readable results for validation checks.
+
+A check collects what it finds as error records and returns them. The text
+report is printed from the same records.
+"""
+
+import functools
+import time
+from pathlib import Path
+
+
+def recorded_check(method):
+    """Decorator for checks that return a list of error records.
+
+    A result dict is appended to the validator's ``results`` list, and the
+    check's callers get True if it found no errors:
+
+        {"validator": "DOCXSchemaValidator", "rule": "validate_xml",
+         "passed": False, "duration": 0.0123,
+         "errors": [{"part": "word/document.xml", "line": 3, "message": "..."}]}
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        errors = method(self, *args, **kwargs)
+        duration = time.perf_counter() - start
+
+        self.results.append(
+            {
+                "validator": type(self).__name__,
+                "rule": method.__name__,
+                "passed": not errors,
+                "duration": round(duration, 6),
+                "errors": errors,
+            }
+        )
+        return not errors
+
+    return wrapper
+
+
+def check_error(part, message, line=None):
+    """Return an error record.
+
+    Args:
+        part: Path of the part relative to the unpacked directory, or None if
+              the error does not concern a single part
+        message: Description of the error
+        line: Line in the part, if known
+
+    Returns:
+        dict: {"part": str or None, "line": int or None, "message": str}
+    """
+    return {
+        "part": Path(part).as_posix() if part is not None else None,
+        "line": line,
+        "message": message,
+    }
+
+
+def format_error(error):
+    """Return the line of the text report for an error record."""
+    location = ""
+    if error["part"] is not None:
+        location += f"{error['part']}: "
+    if error["line"] is not None:
+        location += f"Line {error['line']}: "
+    return f"  {location}{error['message']}"
+
+
+def print_errors(errors):
+    """Print error records as lines of the text report."""
+    for error in errors:
+        print(format_error(error))
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
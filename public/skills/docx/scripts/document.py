@@ -16,33 +16,66 @@ Usage:
     # Add comments
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
+    doc.add_comments([(start, end, "First"), (node, node, "Second")])  # Many at once
 
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply many edits in one pass
+    doc["word/document.xml"].apply_edits([(node, "replace_node", xml), ...])
+
     # Save
     doc.save()
+
+    # Edit a long document on lxml instead of minidom (nodes are lxml elements)
+    doc = Document('workspace/unpacked', backend="lxml")
 """
 
+import copy
+import hashlib
 import html
 import random
 import shutil
+import sys
 import tempfile
+import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+import lxml.etree
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
-from ooxml.scripts.validation.docx import DOCXSchemaValidator
-from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor, _join_text, _max_numeric_id
+
+# The ooxml toolkit is shared with the pptx skill: skills/_shared/ooxml
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "_shared"))
+
+from ooxml.pack import write_part  # noqa: E402
+from ooxml.unpack import (  # noqa: E402
+    LAZY_SOURCE_FILE,
+    read_lazy_parts,
+    unpack_document,
+)
+from ooxml.validation.docx import DOCXSchemaValidator  # noqa: E402
+from ooxml.validation.redlining import RedliningValidator  # noqa: E402
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Parts Document reads or updates itself; if `unpack --only` left them in the
+# original file, they are unpacked when a Document is opened
+DOCUMENT_PARTS = (
+    "word/document.xml",
+    "word/settings.xml",
+    "word/people.xml",
+    "word/comments.xml",
+    "word/commentsExtended.xml",
+    "word/commentsIds.xml",
+    "word/commentsExtensible.xml",
+)
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -72,46 +105,62 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
+        # Highest tracked change ID in use, counted on the first allocation
+        self._max_change_id = None
+
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next tracked change ID.
+
+        The document is scanned for the highest w:ins/w:del ID on the first
+        call, and again after invalidate(); later IDs count on from there.
+        IDs that inserted content already carries are taken into account by
+        _inject_attributes_to_nodes.
+        """
+        if self._max_change_id is None:
+            self._max_change_id = _max_numeric_id(
+                self._attribute(elem, "w:id")
+                for tag in ("w:ins", "w:del")
+                for elem in self._elements_by_tag(tag)
+            )
+        self._max_change_id += 1
+        return self._max_change_id
+
+    def invalidate(self):
+        super().invalidate()
+        self._max_change_id = None
+
+    def _note_change_ids(self, nodes):
+        """Count the IDs of w:ins/w:del elements in inserted nodes as taken."""
+        if self._max_change_id is None:
+            return  # The first allocation scans the whole document
+        self._max_change_id = _max_numeric_id(
+            (
+                self._attribute(elem, "w:id")
+                for node in nodes
+                if self._is_element(node)
+                for elem in self._subtree_elements(node)
+                if self.tag_name(elem) in ("w:ins", "w:del")
+            ),
+            default=self._max_change_id,
+        )
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._declare_namespace(
+            "w16du", "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+        )
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._declare_namespace(
+            "w16cex", "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+        )
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._declare_namespace(
+            "w14", "http://schemas.microsoft.com/office/word/2010/wordml"
+        )
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -131,14 +180,28 @@ class DocxXMLEditor(XMLEditor):
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+        # Answers of is_inside_deletion per ancestor, so that runs sharing a
+        # paragraph or deletion walk up only once between them
+        deletion_state = {}
+
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
+            visited = []
+            inside = False
             parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
-                    return True
+            while parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+                known = deletion_state.get(parent)
+                if known is not None:
+                    inside = known
+                    break
+                if parent.tagName == "w:del":
+                    inside = True
+                    break
+                visited.append(parent)
                 parent = parent.parentNode
-            return False
+            for node in visited:
+                deletion_state[node] = inside
+            return inside
 
         def add_rsid_to_p(elem):
             if not elem.hasAttribute("w:rsidR"):
@@ -204,38 +267,39 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
+        # New IDs must not repeat those the inserted content brings along
+        self._note_change_ids(nodes)
+        self._apply_handlers(nodes, handlers)
+
+    def _apply_handlers(self, nodes, handlers):
+        """Call handlers[tag] on the elements among nodes and their descendants.
+
+        Each node is handled first, then its descendants tag by tag in the
+        order of handlers, found in a single traversal of the node.
+        """
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if not self._is_element(node):
                 continue
 
             # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            handler = handlers.get(self.tag_name(node))
+            if handler is not None:
+                handler(node)
+
+            descendants = self._descendants_by_tag(node, handlers)
+            for tag, handler in handlers.items():
+                for elem in descendants[tag]:
+                    handler(elem)
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -261,6 +325,12 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def apply_edits(self, edits):
+        """Apply edits with automatic attribute injection, in one pass for all."""
+        results = super().apply_edits(edits)
+        self._inject_attributes_to_nodes([node for nodes in results for node in nodes])
+        return results
+
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -285,57 +355,36 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             doc["word/document.xml"].revert_insertion(para)
         """
-        # Collect insertions
-        ins_elements = []
-        if elem.tagName == "w:ins":
-            ins_elements.append(elem)
-        else:
-            ins_elements.extend(elem.getElementsByTagName("w:ins"))
+        # Collect insertions and their runs in one pass
+        revisions = self._collect_revisions(elem, "w:ins")
 
         # Validate that there are insertions to reject
-        if not ins_elements:
+        if not revisions:
             raise ValueError(
                 f"revert_insertion requires w:ins elements. "
                 f"The provided element <{elem.tagName}> contains no insertions. "
             )
 
         # Process all insertions - wrap all children in w:del
-        for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
+        del_wrappers = []
+        for ins_elem, runs in revisions:
             if not runs:
                 continue
+            self._invalidate(ins_elem)
 
-            # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
-
-            # Process each run
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel
             for run in runs:
-                # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Move all children from ins to del wrapper
+                self._mark_run_deleted(run)
+
+            # Move all children from ins to a del wrapper inside it
+            del_wrapper = self.dom.createElement("w:del")
             while ins_elem.firstChild:
                 del_wrapper.appendChild(ins_elem.firstChild)
-
-            # Add del wrapper back to ins
             ins_elem.appendChild(del_wrapper)
+            del_wrappers.append(del_wrapper)
 
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
+        # Inject attributes to the deletion wrappers
+        self._inject_attributes_to_nodes(del_wrappers)
 
         return [elem]
 
@@ -364,69 +413,40 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             nodes = doc["word/document.xml"].revert_deletion(para)
         """
-        # Collect deletions FIRST - before we modify the DOM
-        del_elements = []
+        # Collect deletions and their runs FIRST - before we modify the DOM
         is_single_del = elem.tagName == "w:del"
-
-        if is_single_del:
-            del_elements.append(elem)
-        else:
-            del_elements.extend(elem.getElementsByTagName("w:del"))
+        revisions = self._collect_revisions(elem, "w:del")
 
         # Validate that there are deletions to reject
-        if not del_elements:
+        if not revisions:
             raise ValueError(
                 f"revert_deletion requires w:del elements. "
                 f"The provided element <{elem.tagName}> contains no deletions. "
             )
 
-        # Track created insertion (only relevant if elem is a single w:del)
-        created_insertion = None
-
         # Process all deletions - create insertions that copy the deleted content
-        for del_elem in del_elements:
-            # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
+        insertions = []
+        for del_elem, runs in revisions:
             if not runs:
                 continue
 
-            # Create insertion wrapper
+            # Clone the deleted runs and convert them to insertions
             ins_elem = self.dom.createElement("w:ins")
-
             for run in runs:
-                # Clone the run
                 new_run = run.cloneNode(True)
-
-                # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
-
-                # Update run attributes: w:rsidDel → w:rsidR
-                if new_run.hasAttribute("w:rsidDel"):
-                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
-                    new_run.removeAttribute("w:rsidDel")
-                elif not new_run.hasAttribute("w:rsidR"):
-                    new_run.setAttribute("w:rsidR", self.rsid)
-
+                self._mark_run_inserted(new_run)
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            self._place_fragment(del_elem, "insert_after", [ins_elem])
+            insertions.append(ins_elem)
 
-            # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+        # Inject attributes to the insertions
+        self._inject_attributes_to_nodes(insertions)
 
-        # Return based on input type
-        if is_single_del and created_insertion:
-            return [elem, created_insertion]
+        # Return based on input type; a single w:del comes with its insertion
+        if is_single_del and insertions:
+            return [elem, insertions[0]]
         else:
             return [elem]
 
@@ -499,25 +519,10 @@ class DocxXMLEditor(XMLEditor):
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
+            self._invalidate(elem)
 
-            # Convert w:t → w:delText
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            if elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidDel", elem.getAttribute("w:rsidR"))
-                elem.removeAttribute("w:rsidR")
-            elif not elem.hasAttribute("w:rsidDel"):
-                elem.setAttribute("w:rsidDel", self.rsid)
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel
+            self._mark_run_deleted(elem)
 
             # Wrap in w:del
             del_wrapper = self.dom.createElement("w:del")
@@ -525,6 +530,7 @@ class DocxXMLEditor(XMLEditor):
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
+            self._invalidate(del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -533,11 +539,13 @@ class DocxXMLEditor(XMLEditor):
 
         elif elem.nodeName == "w:p":
             # Check for existing tracked changes
-            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+            found = self._descendants_by_tag(elem, ("w:ins", "w:del", "w:pPr", "w:r"))
+            if found["w:ins"] or found["w:del"]:
                 raise ValueError("w:p element already contains tracked changes")
+            self._invalidate(elem)
 
             # Check if it's a numbered list item
-            pPr_list = elem.getElementsByTagName("w:pPr")
+            pPr_list = found["w:pPr"]
             is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
 
             if is_numbered:
@@ -557,25 +565,9 @@ class DocxXMLEditor(XMLEditor):
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
 
-            # Convert w:t → w:delText in all runs
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            for run in elem.getElementsByTagName("w:r"):
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel in all runs
+            for run in found["w:r"]:
+                self._mark_run_deleted(run)
 
             # Wrap all non-pPr children in <w:del>
             del_wrapper = self.dom.createElement("w:del")
@@ -592,6 +584,392 @@ class DocxXMLEditor(XMLEditor):
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
+    def _collect_revisions(self, elem, tag):
+        """Find the <tag> revisions to process for elem and the runs in each.
+
+        That is elem itself if it is a <tag>, otherwise every <tag> below it.
+        A single traversal carries the enclosing revisions down the tree, so
+        runs are not searched for again below every revision; runs of a nested
+        revision are listed under the revisions around it as well.
+
+        Returns:
+            list: (revision, runs) per revision, in document order
+        """
+        revisions = []
+        stack = [(elem, ())]
+        while stack:
+            node, enclosing = stack.pop()
+            if node.tagName == tag:
+                runs = []
+                revisions.append((node, runs))
+                enclosing = enclosing + (runs,)
+            elif node.tagName == "w:r":
+                for runs in enclosing:
+                    runs.append(node)
+            stack.extend(
+                (child, enclosing)
+                for child in reversed(node.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
+
+        if elem.tagName == tag:
+            return revisions[:1]
+        return revisions
+
+    def _mark_run_deleted(self, run, convert_text=True):
+        """Turn w:rsidR into w:rsidDel and, optionally, w:t into w:delText."""
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+
+        if convert_text:
+            for t_elem in list(run.getElementsByTagName("w:t")):
+                self._rename_element(t_elem, "w:delText")
+
+    def _mark_run_inserted(self, run):
+        """Turn w:delText into w:t and w:rsidDel into w:rsidR."""
+        for del_text in list(run.getElementsByTagName("w:delText")):
+            self._rename_element(del_text, "w:t")
+
+        if run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidR", run.getAttribute("w:rsidDel"))
+            run.removeAttribute("w:rsidDel")
+        elif not run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidR", self.rsid)
+
+    def _rename_element(self, elem, tag):
+        """Replace elem by a <tag> element with the same attributes and children."""
+        renamed = self.dom.createElement(tag)
+        # Copy ALL child nodes (not just firstChild) to handle entities
+        while elem.firstChild:
+            renamed.appendChild(elem.firstChild)
+        # Preserve attributes like xml:space
+        for i in range(elem.attributes.length):
+            attr = elem.attributes.item(i)
+            renamed.setAttribute(attr.name, attr.value)
+        elem.parentNode.replaceChild(renamed, elem)
+
+
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on the lxml backend, see LxmlXMLEditor.
+
+    New elements get the same RSID, author, date and ID attributes, and the
+    tracked-change helpers make the same changes, on lxml elements.
+    """
+
+    def _inject_attributes_to_nodes(self, nodes):
+        """Inject RSID, author, and date attributes; see DocxXMLEditor."""
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        def has(elem, name):
+            clark = self._clark(name)
+            return clark is not None and clark in elem.attrib
+
+        def set_default(elem, name, value):
+            if not has(elem, name):
+                elem.set(self._clark(name), value)
+
+        deletion_state = {}
+
+        def is_inside_deletion(elem):
+            visited = []
+            inside = False
+            for parent in elem.iterancestors():
+                known = deletion_state.get(parent)
+                if known is not None:
+                    inside = known
+                    break
+                if self.tag_name(parent) == "w:del":
+                    inside = True
+                    break
+                visited.append(parent)
+            for node in visited:
+                deletion_state[node] = inside
+            return inside
+
+        def add_rsid_to_p(elem):
+            set_default(elem, "w:rsidR", self.rsid)
+            set_default(elem, "w:rsidRDefault", self.rsid)
+            set_default(elem, "w:rsidP", self.rsid)
+            # Add w14:paraId and w14:textId if not present
+            if not has(elem, "w14:paraId"):
+                self._ensure_w14_namespace()
+                set_default(elem, "w14:paraId", _generate_hex_id())
+            if not has(elem, "w14:textId"):
+                self._ensure_w14_namespace()
+                set_default(elem, "w14:textId", _generate_hex_id())
+
+        def add_rsid_to_r(elem):
+            # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
+            if is_inside_deletion(elem):
+                set_default(elem, "w:rsidDel", self.rsid)
+            else:
+                set_default(elem, "w:rsidR", self.rsid)
+
+        def add_tracked_change_attrs(elem):
+            # Auto-assign w:id if not present
+            if not has(elem, "w:id"):
+                set_default(elem, "w:id", str(self._get_next_change_id()))
+            set_default(elem, "w:author", self.author)
+            set_default(elem, "w:date", timestamp)
+            # Add w16du:dateUtc for tracked changes
+            if not has(elem, "w16du:dateUtc"):
+                self._ensure_w16du_namespace()
+                set_default(elem, "w16du:dateUtc", timestamp)
+
+        def add_comment_attrs(elem):
+            set_default(elem, "w:author", self.author)
+            set_default(elem, "w:date", timestamp)
+            set_default(elem, "w:initials", self.initials)
+
+        def add_comment_extensible_date(elem):
+            if not has(elem, "w16cex:dateUtc"):
+                self._ensure_w16cex_namespace()
+                set_default(elem, "w16cex:dateUtc", timestamp)
+
+        def add_xml_space_to_t(elem):
+            # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
+            text = elem.text
+            if text and (text[0].isspace() or text[-1].isspace()):
+                set_default(elem, "xml:space", "preserve")
+
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
+        self._note_change_ids(nodes)
+        self._apply_handlers(nodes, handlers)
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+        """
+        # Collect insertions and their runs in one pass
+        revisions = self._collect_revisions(elem, "w:ins")
+
+        # Validate that there are insertions to reject
+        if not revisions:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{self.tag_name(elem)}> contains no insertions. "
+            )
+
+        # Process all insertions - wrap all children in w:del
+        del_wrappers = []
+        for ins_elem, runs in revisions:
+            if not runs:
+                continue
+            self._invalidate(ins_elem)
+
+            for run in runs:
+                self._mark_run_deleted(run)
+
+            # Move all content of the insertion into a deletion wrapper
+            children = list(ins_elem)
+            del_wrapper = lxml.etree.SubElement(ins_elem, self._clark("w:del"))
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(children)
+            del_wrappers.append(del_wrapper)
+
+        # Inject attributes to the deletion wrappers
+        self._inject_attributes_to_nodes(del_wrappers)
+
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+        """
+        # Collect deletions and their runs FIRST - before we modify the tree
+        is_single_del = self.tag_name(elem) == "w:del"
+        revisions = self._collect_revisions(elem, "w:del")
+
+        # Validate that there are deletions to reject
+        if not revisions:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{self.tag_name(elem)}> contains no deletions. "
+            )
+
+        # Process all deletions - create insertions that copy the deleted content
+        insertions = []
+        for del_elem, runs in revisions:
+            if not runs:
+                continue
+
+            ins_elem = lxml.etree.Element(self._clark("w:ins"))
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                self._mark_run_inserted(new_run)
+                ins_elem.append(new_run)
+
+            # Copies have no line in the original file
+            for node in ins_elem.iter():
+                node.sourceline = 0
+
+            # Insert the new insertion after the deletion
+            self._place_after(del_elem, None, [ins_elem])
+            insertions.append(ins_elem)
+
+        # Inject attributes to the insertions
+        self._inject_attributes_to_nodes(insertions)
+
+        # Return based on input type; a single w:del comes with its insertion
+        if is_single_del and insertions:
+            return [elem, insertions[0]]
+        else:
+            return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion.
+        """
+        tag = self.tag_name(elem)
+        if tag == "w:r":
+            # Check for existing w:delText
+            if self._descendants(elem, "w:delText"):
+                raise ValueError("w:r element already contains w:delText")
+            self._invalidate(elem)
+
+            self._mark_run_deleted(elem)
+
+            # Wrap in w:del; the text after the run stays outside
+            del_wrapper = elem.makeelement(self._clark("w:del"))
+            elem.addprevious(del_wrapper)
+            del_wrapper.tail, elem.tail = elem.tail, None
+            del_wrapper.append(elem)
+            self._invalidate(del_wrapper)
+
+            # Inject attributes to the deletion wrapper
+            self._inject_attributes_to_nodes([del_wrapper])
+
+            return del_wrapper
+
+        elif tag == "w:p":
+            # Check for existing tracked changes
+            found = self._descendants_by_tag(
+                elem, ("w:ins", "w:del", "w:pPr", "w:t", "w:r")
+            )
+            if found["w:ins"] or found["w:del"]:
+                raise ValueError("w:p element already contains tracked changes")
+            self._invalidate(elem)
+
+            # Check if it's a numbered list item
+            pPr_list = found["w:pPr"]
+            is_numbered = pPr_list and self._descendants(pPr_list[0], "w:numPr")
+
+            if is_numbered:
+                # Add <w:del/> to w:rPr in w:pPr
+                pPr = pPr_list[0]
+                rPr_list = self._descendants(pPr, "w:rPr")
+
+                if not rPr_list:
+                    rPr = lxml.etree.SubElement(pPr, self._clark("w:rPr"))
+                else:
+                    rPr = rPr_list[0]
+
+                # Add <w:del/> marker as the very first child
+                del_marker = rPr.makeelement(self._clark("w:del"))
+                del_marker.tail, rPr.text = rPr.text, None
+                rPr.insert(0, del_marker)
+
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel in all runs
+            del_text_tag = self._clark("w:delText")
+            for t_elem in found["w:t"]:
+                t_elem.tag = del_text_tag
+            for run in found["w:r"]:
+                self._mark_run_deleted(run, convert_text=False)
+
+            # Move everything but w:pPr, text included, into <w:del>
+            del_wrapper = elem.makeelement(self._clark("w:del"))
+            del_wrapper.text, elem.text = elem.text, None
+            last_moved = None
+            for child in list(elem):
+                trailing, child.tail = child.tail, None
+                if not (self._is_element(child) and self.tag_name(child) == "w:pPr"):
+                    del_wrapper.append(child)
+                    last_moved = child
+                if last_moved is None:
+                    del_wrapper.text = _join_text(del_wrapper.text, trailing)
+                else:
+                    last_moved.tail = _join_text(last_moved.tail, trailing)
+            elem.append(del_wrapper)
+
+            # Inject attributes to the deletion wrapper
+            self._inject_attributes_to_nodes([del_wrapper])
+
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+    def _collect_revisions(self, elem, tag):
+        # lxml finds descendants by tag without visiting elements in Python
+        if self.tag_name(elem) == tag:
+            revisions = [elem]
+        else:
+            revisions = self._descendants(elem, tag)
+        return [
+            (revision, self._descendants(revision, "w:r")) for revision in revisions
+        ]
+
+    def _mark_run_deleted(self, run, convert_text=True):
+        """Turn w:rsidR into w:rsidDel and, optionally, w:t into w:delText."""
+        rsid_r = self._clark("w:rsidR")
+        rsid_del = self._clark("w:rsidDel")
+        if rsid_r in run.attrib:
+            run.set(rsid_del, run.attrib.pop(rsid_r))
+        elif rsid_del not in run.attrib:
+            run.set(rsid_del, self.rsid)
+
+        if convert_text:
+            del_text_tag = self._clark("w:delText")
+            for t_elem in self._descendants(run, "w:t"):
+                t_elem.tag = del_text_tag
+
+    def _mark_run_inserted(self, run):
+        """Turn w:delText into w:t and w:rsidDel into w:rsidR."""
+        t_tag = self._clark("w:t")
+        for del_text in self._descendants(run, "w:delText"):
+            del_text.tag = t_tag
+
+        rsid_r = self._clark("w:rsidR")
+        rsid_del = self._clark("w:rsidDel")
+        if rsid_del in run.attrib:
+            run.set(rsid_r, run.attrib.pop(rsid_del))
+        elif rsid_r not in run.attrib:
+            run.set(rsid_r, self.rsid)
+
+
+def _is_xml_part(part):
+    """Whether a package path is an XML part that validation looks at."""
+    return part.endswith((".xml", ".rels"))
+
+
+def _file_signature(path, part):
+    """Return the signature Document uses to tell whether a file changed.
+
+    XML and .rels parts are compared by content hash, since editors rewrite
+    them on save; other files by size and modification time, so media is
+    not read.
+    """
+    if _is_xml_part(part):
+        return hashlib.sha256(path.read_bytes()).digest()
+    stat = path.stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
 
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
@@ -619,31 +997,64 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
+        The Document works on a temporary copy of the XML parts at
+        unpacked_path. Media and other files are not copied: they are read
+        from the original directory, and save() copies them to any other
+        destination. Files written into unpacked_path (e.g. new images)
+        are saved like edited parts, and replace the original's file of the
+        same name. Files left in the original directory cannot be removed
+        through the Document.
+
+        If the directory was unpacked with `unpack.py --only`, the parts in
+        DOCUMENT_PARTS that were left in the original file are unpacked into
+        it first, as unpacking them again would. Other such parts are
+        unpacked when first accessed through doc[...].
+
         Args:
             unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: XML backend for word/document.xml: "minidom" (default) or
+                     "lxml", which parses long documents several times faster
+                     in a fraction of the memory. With "lxml", nodes of
+                     word/document.xml are lxml elements; other parts always
+                     use minidom.
         """
+        if backend not in ("minidom", "lxml"):
+            raise ValueError(
+                f"Unknown backend {backend!r}, expected 'minidom' or 'lxml'"
+            )
+        self.backend = backend
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
+        self._unpack_lazy_parts(DOCUMENT_PARTS)
+
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self._shared_files = self._copy_xml_parts()
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+        # Signatures of the starting files, used to validate only edited parts
+        # and to save only the files that changed
+        self._baseline_files = self._snapshot_files()
+        self._schema_validator = None
+
+        # Temporary .docx with the original XML parts for the validators, written
+        # on first validation or before save() first overwrites an original
+        # part (outside unpacked dir). Until then the original directory
+        # serves as baseline.
         self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
 
         self.word_path = self.unpacked_path / "word"
 
@@ -663,6 +1074,7 @@ class Document:
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
+        self._comment_parts_registered = False
 
         # Load existing comments and determine next ID (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
@@ -691,7 +1103,8 @@ class Document:
             DocxXMLEditor instance for the specified file
 
         Raises:
-            ValueError: If the file does not exist
+            ValueError: If the file does not exist, and is not a part that
+                `unpack.py --only` left in the original file
 
         Example:
             # Get node from document.xml
@@ -702,10 +1115,15 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
+            if not file_path.exists() and self._unpack_lazy_parts([xml_path]):
+                self._add_baseline_part(xml_path)
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            editor_class = DocxXMLEditor
+            if self.backend == "lxml" and xml_path == "word/document.xml":
+                editor_class = LxmlDocxXMLEditor
+            self._editors[xml_path] = editor_class(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
@@ -727,40 +1145,55 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+        return self.add_comments([(start, end, text)])[0]
 
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+    def add_comments(self, comments) -> list:
+        """
+        Add many comments at once.
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        The result is the same as calling add_comment for each comment in
+        order, but the markup of all comments is parsed together: one
+        apply_edits call on document.xml and one append to each of
+        comments.xml, commentsExtended.xml, commentsIds.xml and
+        commentsExtensible.xml.
 
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
+        Args:
+            comments: Iterable of (start, end, text) tuples, as for add_comment
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Returns:
+            List of the comment IDs that were created, in order
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Example:
+            ids = doc.add_comments([
+                (para, para, "Check this clause"),
+                (start_run, end_run, "Defined term"),
+            ])
+        """
+        entries = []
+        edits = []
+        for start, end, text in comments:
+            comment_id = self.next_comment_id
+            self.next_comment_id += 1
+            entries.append(
+                (comment_id, _generate_hex_id(), _generate_hex_id(), text, None)
+            )
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+            # Comment ranges in document.xml. If end node is a paragraph, append
+            # comment markup inside it; otherwise insert after it (for run-level
+            # anchors)
+            edits.append(
+                (start, "insert_before", self._comment_range_start_xml(comment_id))
+            )
+            if self._document.tag_name(end) == "w:p":
+                end_operation = "append_to"
+            else:
+                end_operation = "insert_after"
+            edits.append((end, end_operation, self._comment_range_end_xml(comment_id)))
 
-        self.next_comment_id += 1
-        return comment_id
+        if entries:
+            self._document.apply_edits(edits)
+            self._add_to_comment_parts(entries)
+        return [entry[0] for entry in entries]
 
     def reply_to_comment(
         self,
@@ -787,7 +1220,6 @@ class Document:
         comment_id = self.next_comment_id
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
         parent_start_elem = self._document.get_node(
@@ -800,7 +1232,7 @@ class Document:
         self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
-        parent_ref_run = parent_ref_elem.parentNode
+        parent_ref_run = self._document.parent_node(parent_ref_elem)
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
@@ -808,25 +1240,11 @@ class Document:
             parent_ref_run, self._comment_ref_run_xml(comment_id)
         )
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
-
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
+        # Add to the comment parts immediately (with parent)
+        self._add_to_comment_parts(
+            [(comment_id, para_id, durable_id, text, parent_info["para_id"])]
         )
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
-
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
-
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
-
         self.next_comment_id += 1
         return comment_id
 
@@ -835,41 +1253,71 @@ class Document:
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
-    def validate(self) -> None:
+    def validate(self, jobs=1) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Per-file checks only run on parts whose content changed since the
+        Document was opened. Repeated calls reuse the same schema validator,
+        so cross-part checks only re-read the edited parts.
+
+        Args:
+            jobs: Number of worker processes for per-part XSD validation (default: 1)
+
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
+        changed_parts = self._get_changed_parts()
+        if not self.original_docx.exists():
+            self._write_baseline()
+
+        # Create or refresh validators with current state
+        if self._schema_validator is None:
+            self._schema_validator = DOCXSchemaValidator(
+                self.unpacked_path,
+                self.original_docx,
+                verbose=False,
+                jobs=jobs,
+                changed_parts=changed_parts,
+                lazy_parts=self._shared_files,
+            )
+        else:
+            self._schema_validator.jobs = jobs
+            self._schema_validator.refresh(changed_parts)
 
         # Run validations
-        if not schema_validator.validate():
+        if not self._schema_validator.validate():
             raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+
+        # Redlining only compares document.xml text, which is unchanged otherwise
+        if "word/document.xml" in changed_parts:
+            redlining_validator = RedliningValidator(
+                self.unpacked_path, self.original_docx, verbose=False
+            )
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
 
     def save(self, destination=None, validate=True) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Saving back to the original directory only writes the files that were
+        added or changed in unpacked_path, including media copied there. Any
+        other destination receives a complete copy: unpacked_path plus the
+        files read from the original directory. On both, the files deleted
+        from unpacked_path are removed.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        # Only ensure comment relationships and content types if comment files
+        # exist; once done they stay in place
+        if self.comments_path.exists() and not self._comment_parts_registered:
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
+            self._comment_parts_registered = True
 
         # Save all modified XML files in temp directory
         for editor in self._editors.values():
@@ -881,25 +1329,142 @@ class Document:
 
         # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        changed, removed = self._get_changed_files()
+        if target_path.resolve() == self.original_path.resolve():
+            # The original already holds every file that did not change. Its
+            # parts are the validation baseline, so pack them before they are
+            # overwritten.
+            if not self.original_docx.exists() and (
+                (changed | removed) & self._baseline_files.keys()
+            ):
+                self._write_baseline()
+            sources = {part: self.unpacked_path / part for part in changed}
+        else:
+            sources = {part: self.original_path / part for part in self._shared_files}
+            sources.update(
+                (part, self.unpacked_path / part) for part in self._working_files()
+            )
+
+        for part in sorted(removed):
+            (target_path / part).unlink(missing_ok=True)
+        for part, source in sorted(sources.items()):
+            target_file = target_path / part
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target_file)
 
     # ==================== Private: Initialization ====================
 
+    def _copy_xml_parts(self):
+        """Copy the XML parts of the original directory into unpacked_path.
+
+        The `unpack.py --only` record is copied along, so the validators know
+        the parts left in the original file.
+
+        Returns:
+            set: Relative paths of the other files, which stay in the original
+            directory
+        """
+        self.unpacked_path.mkdir()
+        shared = set()
+        for path in self.original_path.rglob("*"):
+            if not path.is_file():
+                continue
+            part = path.relative_to(self.original_path).as_posix()
+            if _is_xml_part(part) or part == LAZY_SOURCE_FILE:
+                target_file = self.unpacked_path / part
+                target_file.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, target_file)
+            else:
+                shared.add(part)
+        return shared
+
+    def _working_files(self):
+        """Return the relative paths of the files in unpacked_path."""
+        return [
+            path.relative_to(self.unpacked_path).as_posix()
+            for path in self.unpacked_path.rglob("*")
+            if path.is_file()
+        ]
+
+    def _snapshot_files(self):
+        """Return a signature for every file, keyed by relative path."""
+        return {
+            part: _file_signature(self.unpacked_path / part, part)
+            for part in self._working_files()
+        }
+
+    def _unpack_lazy_parts(self, parts):
+        """Unpack parts that `unpack.py --only` left in the original file.
+
+        They are unpacked into the original directory from the source archive
+        it records, as running unpack.py again would.
+
+        Returns:
+            list: The parts that were unpacked
+        """
+        lazy = read_lazy_parts(self.original_path)
+        if lazy is None:
+            return []
+        source, lazy_parts = lazy
+        parts = [part for part in parts if part in set(lazy_parts)]
+        if parts:
+            unpack_document(source, self.original_path, only=parts)
+        return parts
+
+    def _add_baseline_part(self, part):
+        """Copy a part unpacked after opening into the session, unchanged."""
+        target_file = self.unpacked_path / part
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(self.original_path / part, target_file)
+        self._baseline_files[part] = _file_signature(target_file, part)
+
+        # A baseline written before the part was unpacked lacks it
+        if self.original_docx.exists():
+            with zipfile.ZipFile(self.original_docx, "a", zipfile.ZIP_DEFLATED) as zf:
+                write_part(zf, self.original_path / part, part)
+
+    def _write_baseline(self):
+        """Pack the original XML parts into original.docx for the validators.
+
+        Parts are condensed as pack_document does. Media and other binary parts
+        are left out, since validation only compares XML parts.
+        """
+        with zipfile.ZipFile(self.original_docx, "w", zipfile.ZIP_DEFLATED) as zf:
+            for part in sorted(filter(_is_xml_part, self._baseline_files)):
+                write_part(zf, self.original_path / part, part)
+
+    def _get_changed_files(self):
+        """Return the files added or modified, and the files removed, since open."""
+        current = self._snapshot_files()
+        changed = {
+            part
+            for part, signature in current.items()
+            if self._baseline_files.get(part) != signature
+        }
+        return changed, set(self._baseline_files) - set(current)
+
+    def _get_changed_parts(self):
+        """Return the XML parts added or modified since the Document was opened."""
+        changed, _ = self._get_changed_files()
+        return set(filter(_is_xml_part, changed))
+
     def _get_next_comment_id(self):
-        """Get the next available comment ID."""
+        """Get the next available comment ID.
+
+        Called once at load time; add_comment and reply_to_comment count on
+        from there through next_comment_id.
+        """
         if not self.comments_path.exists():
             return 0
 
         editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+        return (
+            _max_numeric_id(
+                comment_elem.getAttribute("w:id")
+                for comment_elem in editor.dom.getElementsByTagName("w:comment")
+            )
+            + 1
+        )
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
@@ -1065,31 +1630,49 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_to_comment_parts(self, entries):
+        """Add comments to the four comment parts with one append per part.
+
+        Args:
+            entries: (comment_id, para_id, durable_id, text, parent_para_id) per
+                     comment, where parent_para_id is None unless it is a reply
+        """
+        self._add_to_comments_xml(entries)
+        self._add_to_comments_extended_xml(entries)
+        self._add_to_comments_ids_xml(entries)
+        self._add_to_comments_extensible_xml(entries)
+
+        # Update existing_comments so replies work
+        for comment_id, para_id, _, _, _ in entries:
+            self.existing_comments[comment_id] = {"para_id": para_id}
+
+    def _add_to_comments_xml(self, entries):
+        """Add comments to comments.xml."""
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
         # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
         # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        comment_xmls = []
+        for comment_id, para_id, _, text, _ in entries:
+            escaped_text = (
+                text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            )
+            comment_xmls.append(
+                f'''<w:comment w:id="{comment_id}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
 </w:comment>'''
-        editor.append_to(root, comment_xml)
+            )
+        editor.append_to(root, "".join(comment_xmls))
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+    def _add_to_comments_extended_xml(self, entries):
+        """Add comments to commentsExtended.xml."""
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
@@ -1098,25 +1681,32 @@ class Document:
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        xmls = []
+        for _, para_id, _, _, parent_para_id in entries:
+            if parent_para_id:
+                xmls.append(
+                    f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+                )
+            else:
+                xmls.append(f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>')
+        editor.append_to(root, "".join(xmls))
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+    def _add_to_comments_ids_xml(self, entries):
+        """Add comments to commentsIds.xml."""
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+            for _, para_id, durable_id, _, _ in entries
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, entries):
+        """Add comments to commentsExtensible.xml."""
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
@@ -1125,7 +1715,10 @@ class Document:
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+            for _, _, durable_id, _, _ in entries
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
@@ -0,0 +1,150 @@
+import contextlib
+import io
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from .document import Document
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+PARTS = {
+    "[Content_Types].xml": """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Default Extension="png" ContentType="image/png"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>
+</Types>""",
+    "_rels/.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="{RELATIONSHIPS}/officeDocument" Target="word/document.xml"/>
+</Relationships>""",
+    "word/_rels/document.xml.rels": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="{RELATIONSHIPS}/settings" Target="settings.xml"/>
+<Relationship Id="rId2" Type="{RELATIONSHIPS}/image" Target="media/image1.png"/>
+<Relationship Id="rId3" Type="{RELATIONSHIPS}/customXml" Target="extra.xml"/>
+</Relationships>""",
+    "word/document.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NAMESPACE}">
+  <w:body>
+    <w:p>
+      <w:r>
+        <w:t>The term is monthly.</w:t>
+      </w:r>
+    </w:p>
+  </w:body>
+</w:document>""",
+    "word/settings.xml": f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NAMESPACE}"/>""",
+    "word/media/image1.png": "not really a png",
+    "word/extra.xml": "<extra/>",
+}
+
+
+# Run from the docx skill root with: python -m unittest scripts.document_test
+class TestDocumentWorkingCopy(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+        self.unpacked = self.root / "unpacked"
+        for name, text in PARTS.items():
+            path = self.unpacked / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.doc = Document(self.unpacked, rsid="00AB12CD")
+        self.addCleanup(shutil.rmtree, self.doc.temp_dir, True)
+
+    def save(self, destination=None, validate=True):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.doc.save(destination, validate=validate)
+
+    def test_open_copies_only_xml_parts(self):
+        working = self.doc.unpacked_path
+        self.assertTrue((working / "word" / "document.xml").is_file())
+        self.assertFalse((working / "word" / "media").exists())
+
+        para = self.doc["word/document.xml"].get_node(tag="w:p")
+        self.doc.add_comment(start=para, end=para, text="Check this")
+        self.save()
+
+        self.assertTrue((self.unpacked / "word" / "comments.xml").is_file())
+        self.assertEqual(
+            (self.unpacked / "word" / "media" / "image1.png").read_text(),
+            "not really a png",
+        )
+
+    def test_file_written_to_working_copy_replaces_original(self):
+        (self.doc.unpacked_path / "word" / "media").mkdir()
+        (self.doc.unpacked_path / "word" / "media" / "image1.png").write_text("new")
+
+        self.save()
+
+        self.assertEqual(
+            (self.unpacked / "word" / "media" / "image1.png").read_text(), "new"
+        )
+
+    def test_save_to_destination_writes_complete_copy(self):
+        (self.doc.unpacked_path / "word" / "media").mkdir()
+        (self.doc.unpacked_path / "word" / "media" / "image1.png").write_text("new")
+        destination = self.root / "copy"
+
+        self.save(destination)
+
+        on_disk = {
+            path.relative_to(destination).as_posix()
+            for path in destination.rglob("*")
+            if path.is_file()
+        }
+        self.assertTrue(set(PARTS) <= on_disk)
+        self.assertIn("word/people.xml", on_disk)
+        self.assertEqual(
+            (destination / "word" / "media" / "image1.png").read_text(), "new"
+        )
+        self.assertEqual(
+            (self.unpacked / "word" / "media" / "image1.png").read_text(),
+            "not really a png",
+        )
+
+    def test_removed_part_is_removed_from_original(self):
+        (self.doc.unpacked_path / "word" / "extra.xml").unlink()
+
+        self.save(validate=False)
+
+        self.assertFalse((self.unpacked / "word" / "extra.xml").exists())
+
+    def test_removed_part_is_removed_from_destination(self):
+        destination = self.root / "copy"
+        shutil.copytree(self.unpacked, destination)
+        (self.doc.unpacked_path / "word" / "extra.xml").unlink()
+
+        self.save(destination, validate=False)
+
+        self.assertFalse((destination / "word" / "extra.xml").exists())
+
+    def test_validation_baseline_survives_saving_without_validation(self):
+        editor = self.doc["word/document.xml"]
+        run = editor.get_node(tag="w:r", contains="monthly")
+        editor.replace_node(
+            run,
+            "<w:r><w:t>The term is weekly.</w:t></w:r>"
+            "<w:ins><w:r><w:t> It renews.</w:t></w:r></w:ins>",
+        )
+
+        self.save(validate=False)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaisesRegex(ValueError, "Redlining validation failed"):
+                self.doc.validate()
+
+
+if __name__ == "__main__":
+    unittest.main()
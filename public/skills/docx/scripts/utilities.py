@@ -22,12 +22,25 @@ Example usage:
     # Combine filters
     elem = editor.get_node(tag="w:p", line_number=range(1, 50), contains="text")
 
+    # Find text split across runs: (paragraph, [(w:t, start, end), ...])
+    for para, segments in editor.find_text("specific text"):
+        ...
+
     # Replace, insert, or manipulate
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
 
     # Save changes
     editor.save()
+
+get_node answers from indexes by tag, by source line and by common ID
+attributes, built on first use and updated for the subtrees that replace_node,
+insert_after, insert_before and append_to change. The text that contains=
+and find_text search is cached per element and dropped along with those
+subtrees and the elements around them. Edits made directly through the DOM
+(or lxml) are not seen by the indexes, the cached text or the ID counters:
+call invalidate() after them, before the next lookup or edit through the
+editor.
 """
 
 import html
@@ -36,6 +49,13 @@ from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Attributes get_node looks up through an index instead of scanning by tag
+INDEXED_ATTRIBUTES = ("w:id", "w14:paraId", "w14:textId", "w15:paraId", "Id")
+
+# Editing methods that apply_edits accepts as operations
+EDIT_OPERATIONS = ("replace_node", "insert_after", "insert_before", "append_to")
 
 
 class XMLEditor:
@@ -70,6 +90,23 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
+        self._parse()
+
+        # get_node indexes, built on first lookup: bucket key -> elements,
+        # element -> the keys it is filed under, and subtrees to re-index
+        self._buckets = None
+        self._index_keys = None
+        self._stale_subtrees = []
+
+        # Text of elements for contains= searches, element -> text; filled in
+        # as elements are looked at and dropped when their subtree changes
+        self._texts = None
+
+        # Highest rId number in use, counted on the first get_next_rid call
+        self._max_rid = None
+
+    def _parse(self):
+        """Parse xml_path into the tree this editor works on."""
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
 
@@ -84,7 +121,9 @@ class XMLEditor:
         Get a DOM element by tag and identifier.
 
         Finds an element by either its line number in the original file or by
-        matching attribute values. Exactly one match must be found.
+        matching attribute values. Exactly one match must be found. After
+        editing the tree directly rather than through the editor, call
+        invalidate() first.
 
         Args:
             tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
@@ -92,6 +131,7 @@ class XMLEditor:
             line_number: Line number (int) or line range (range) in original XML file (1-indexed)
             contains: Text string that must appear in any text node within the element.
                       Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+                      Matched against text cached since the last invalidate()
 
         Returns:
             defusedxml.minidom.Element: The matching DOM element
@@ -109,40 +149,40 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        candidates = self._candidates(tag, attrs, line_number)
+        if normalized_contains is not None:
+            # Cheap test against the cached text before the full check
+            text_of = self._text_of
+            candidates = [
+                elem for elem in candidates if normalized_contains in text_of(elem)
+            ]
+        matches = [
+            elem
+            for elem in candidates
+            if self._matches(elem, attrs, line_number, normalized_contains)
+            and self._is_attached(elem)
+        ]
+        if normalized_contains is not None and not all(
+            normalized_contains in self._get_element_text(elem) for elem in matches
+        ):
+            # The cached text is stale, so other elements may match as well
+            matches = []
+        if not matches:
+            # Elements added or changed by direct DOM edits may be missing from
+            # the indexes, so confirm with a full scan before reporting an error
+            if normalized_contains is not None:
+                self._texts = None
+            matches = [
+                elem
+                for elem in self._elements_by_tag(tag)
+                if self._matches(elem, attrs, line_number, normalized_contains)
+            ]
+            if matches:
+                self._buckets = None  # Out of date; rebuild on next lookup
 
         if not matches:
             # Build descriptive error message
@@ -164,7 +204,10 @@ class XMLEditor:
 
             # Add helpful hint based on filters used
             if contains:
-                hint = "Text may be split across elements or use different wording."
+                hint = (
+                    "Text may be split across elements (find_text searches "
+                    "across runs) or use different wording."
+                )
             elif line_number:
                 hint = "Line numbers may have changed if document was modified."
             elif attrs:
@@ -180,6 +223,292 @@ class XMLEditor:
             )
         return matches[0]
 
+    def find_text(self, text, tag="w:p"):
+        """
+        Find text inside elements, including text split across several runs.
+
+        Word often splits a sentence into several runs (at formatting changes,
+        spell-check marks or revision boundaries), so get_node(tag="w:r",
+        contains=...) cannot find it. find_text searches the whole text of
+        each <tag> element and reports which text elements every occurrence
+        covers.
+
+        Args:
+            text: Text to find. Supports both entity notation (&#8220;) and
+                  Unicode characters (\u201c).
+            tag: Element whose text is searched (default: "w:p"). Like
+                 get_node's contains=, the search uses text cached since the
+                 last invalidate()
+
+        Returns:
+            List of (elem, segments) per occurrence, in document order: elem is
+            the <tag> element, and segments lists (text_elem, start, end) for
+            each piece of the occurrence - the element holding the text (e.g.
+            a w:t) and the character range within that text
+
+        Raises:
+            ValueError: If text is empty
+
+        Example:
+            for para, segments in editor.find_text("Effective Date"):
+                runs = [editor.parent_node(t) for t, start, end in segments]
+        """
+        text = html.unescape(text)
+        if not text:
+            raise ValueError("Text to find must not be empty")
+
+        text_of = self._text_of
+        found = [
+            elem
+            for elem in self._candidates(tag, None, None)
+            if text in text_of(elem) and self._is_attached(elem)
+        ]
+        if not found:
+            # As in get_node, direct DOM edits may have left the indexes behind
+            self._texts = None
+            found = [
+                elem
+                for elem in self._elements_by_tag(tag)
+                if text in self._text_of(elem)
+            ]
+            if found:
+                self._buckets = None
+        elif len(found) > 1 and tag != "*":
+            # Index buckets keep insertion order rather than document order
+            found = set(found)
+            found = [elem for elem in self._elements_by_tag(tag) if elem in found]
+
+        results = []
+        for elem in found:
+            pieces = list(self._text_holders(elem))
+            content = "".join(piece for _, piece in pieces)
+            start = content.find(text)
+            while start != -1:
+                end = start + len(text)
+                segments = []
+                offset = 0
+                for holder, piece in pieces:
+                    piece_end = offset + len(piece)
+                    if piece_end > start and offset < end:
+                        segments.append(
+                            (
+                                holder,
+                                max(start, offset) - offset,
+                                min(end, piece_end) - offset,
+                            )
+                        )
+                    offset = piece_end
+                results.append((elem, segments))
+                start = content.find(text, end)
+        return results
+
+    def _matches(self, elem, attrs, line_number, contains):
+        """Check an element against the get_node filters (contains normalized)."""
+        # Check line_number filter
+        if line_number is not None:
+            elem_line = self._line_of(elem)
+
+            # Handle both single line number and range
+            if isinstance(line_number, range):
+                if elem_line not in line_number:
+                    return False
+            else:
+                if elem_line != line_number:
+                    return False
+
+        # Check attrs filter
+        if attrs is not None:
+            if not all(
+                self._attribute(elem, attr_name) == attr_value
+                for attr_name, attr_value in attrs.items()
+            ):
+                return False
+
+        # Check contains filter
+        if contains is not None:
+            if contains not in self._text_of(elem):
+                return False
+
+        return True
+
+    def _candidates(self, tag, attrs, line_number):
+        """Return the elements that may match, from the most selective index.
+
+        Candidates still have to pass _matches; elements removed from the
+        document by direct DOM edits may be among them.
+        """
+        if tag == "*":
+            return self._elements_by_tag(tag)
+        self._ensure_index()
+
+        for attr_name, attr_value in (attrs or {}).items():
+            if attr_name in INDEXED_ATTRIBUTES and attr_value:
+                return self._buckets.get(("attr", tag, attr_name, attr_value), ())
+
+        if line_number is not None:
+            if not isinstance(line_number, range):
+                return self._buckets.get(("line", tag, line_number), ())
+            if len(line_number) <= len(self._buckets):
+                return [
+                    elem
+                    for line in line_number
+                    for elem in self._buckets.get(("line", tag, line), ())
+                ]
+            return [
+                elem
+                for key, bucket in self._buckets.items()
+                if key[0] == "line" and key[1] == tag and key[2] in line_number
+                for elem in bucket
+            ]
+
+        return self._buckets.get(("tag", tag), ())
+
+    def _ensure_index(self):
+        """Build the get_node indexes, or re-index subtrees changed since."""
+        if self._buckets is None:
+            self._buckets = {}
+            self._index_keys = {}
+            self._stale_subtrees = []
+            if self._root() is not None:
+                self._index_subtree(self._root())
+        elif self._stale_subtrees:
+            stale, self._stale_subtrees = self._stale_subtrees, []
+            for node in stale:
+                if self._is_attached(node):
+                    self._index_subtree(node)
+
+    def _index_subtree(self, node):
+        for elem in self._subtree_elements(node):
+            self._unindex_element(elem)
+            tag = self.tag_name(elem)
+            keys = [("tag", tag)]
+            line = self._line_of(elem)
+            if line is not None:
+                keys.append(("line", tag, line))
+            for attr_name in INDEXED_ATTRIBUTES:
+                attr_value = self._attribute(elem, attr_name)
+                if attr_value:
+                    keys.append(("attr", tag, attr_name, attr_value))
+
+            for key in keys:
+                self._buckets.setdefault(key, {})[elem] = None
+            self._index_keys[elem] = keys
+
+    def _unindex_element(self, elem):
+        for key in self._index_keys.pop(elem, ()):
+            bucket = self._buckets[key]
+            del bucket[elem]
+            if not bucket:
+                del self._buckets[key]
+
+    def _forget(self, node):
+        """Drop a subtree that is about to leave the document from the indexes."""
+        if not self._is_element(node):
+            return
+        self._forget_text(node)
+        if self._buckets is not None:
+            for elem in self._subtree_elements(node):
+                self._unindex_element(elem)
+
+    def _invalidate(self, node):
+        """Re-index a new or changed subtree on the next lookup.
+
+        May be called before the subtree is changed: elements it loses are
+        dropped now, and what it holds by the next lookup is indexed then.
+        """
+        if not self._is_element(node):
+            return
+        self._forget(node)
+        if self._buckets is not None:
+            self._stale_subtrees.append(node)
+
+    def invalidate(self):
+        """
+        Forget what the editor derived from the tree after direct edits.
+
+        get_node's indexes, the text cached for contains= and find_text, and
+        the ID counters are kept up to date by the editor's own methods only.
+        Call this after changing the tree directly (adding, moving or removing
+        nodes, or changing attributes or text through the DOM or lxml), before
+        the next lookup or edit through the editor. Everything is rebuilt on
+        next use.
+
+        Example:
+            para = editor.get_node(tag="w:p", contains="old text")
+            para.parentNode.appendChild(para)
+            editor.invalidate()
+        """
+        self._buckets = None
+        self._texts = None
+        self._max_rid = None
+
+    def _text_of(self, elem):
+        """Return _get_element_text(elem), cached until the element changes.
+
+        Changes made through the editing methods drop the cached text of the
+        subtree and of the elements around it; direct edits need invalidate().
+        """
+        if self._texts is None:
+            self._texts = {}
+        text = self._texts.get(elem)
+        if text is None:
+            text = self._texts[elem] = self._get_element_text(elem)
+        return text
+
+    def _forget_text(self, node):
+        """Drop the cached text of a subtree and of the elements containing it."""
+        if not self._texts:
+            return
+        for elem in self._subtree_elements(node):
+            self._texts.pop(elem, None)
+        parent = self.parent_node(node)
+        while parent is not None:
+            self._texts.pop(parent, None)
+            parent = self.parent_node(parent)
+
+    def tag_name(self, elem):
+        """Return an element's prefixed tag name (e.g. "w:p")."""
+        return elem.tagName
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing."""
+        root = self.dom.documentElement
+        if not root.hasAttribute(f"xmlns:{prefix}"):  # type: ignore
+            root.setAttribute(f"xmlns:{prefix}", uri)  # type: ignore
+
+    def parent_node(self, elem):
+        """Return an element's parent, or None for a detached element."""
+        return elem.parentNode
+
+    # Tree access used by get_node and its indexes; LxmlXMLEditor overrides
+    # these for lxml elements
+
+    def _root(self):
+        return self.dom.documentElement
+
+    def _elements_by_tag(self, tag):
+        return self.dom.getElementsByTagName(tag)
+
+    def _subtree_elements(self, node):
+        return _iter_elements(node)
+
+    def _is_element(self, node):
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _line_of(self, elem):
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _attribute(self, elem, name):
+        return elem.getAttribute(name)
+
+    def _is_attached(self, node):
+        """Check whether a node is still part of the document."""
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -203,6 +532,15 @@ class XMLEditor:
                 text_parts.append(self._get_element_text(node))
         return "".join(text_parts)
 
+    def _text_holders(self, elem):
+        """Yield (element holding the text, text) for the text in elem, in order."""
+        for node in elem.childNodes:
+            if node.nodeType == node.TEXT_NODE:
+                if node.data.strip():
+                    yield elem, node.data
+            elif node.nodeType == node.ELEMENT_NODE:
+                yield from self._text_holders(node)
+
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
@@ -217,12 +555,9 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._place_fragment(
+            elem, "replace_node", self._parse_fragment(new_content)
+        )
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +573,9 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._place_fragment(
+            elem, "insert_after", self._parse_fragment(xml_content)
+        )
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +591,9 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._place_fragment(
+            elem, "insert_before", self._parse_fragment(xml_content)
+        )
 
     def append_to(self, elem, xml_content):
         """
@@ -282,22 +609,81 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
-        return nodes
+        return self._place_fragment(
+            elem, "append_to", self._parse_fragment(xml_content)
+        )
+
+    def apply_edits(self, edits):
+        """
+        Apply many edits at once, parsing all their XML in a single pass.
+
+        Each edit names one of the editing methods as its operation:
+        "replace_node", "insert_after", "insert_before" or "append_to". Edits
+        are applied in order with the same result as calling those methods
+        one after the other, so an edit must not target an element that an
+        earlier one removed.
+
+        Args:
+            edits: Iterable of (elem, operation, xml_content) tuples
+
+        Returns:
+            List[List[defusedxml.minidom.Node]]: The inserted nodes of each edit
+
+        Raises:
+            ValueError: If an operation is not one of the editing methods
+
+        Example:
+            results = editor.apply_edits([
+                (para, "insert_after", "<w:p><w:r><w:t>text</w:t></w:r></w:p>"),
+                (run, "replace_node", "<w:r><w:t>other text</w:t></w:r>"),
+            ])
+        """
+        edits = list(edits)
+        for _, operation, _ in edits:
+            if operation not in EDIT_OPERATIONS:
+                raise ValueError(
+                    f"Unknown edit operation {operation!r}, expected one of "
+                    + ", ".join(EDIT_OPERATIONS)
+                )
+        fragments = self._parse_fragments([content for _, _, content in edits])
+        return [
+            self._place_fragment(elem, operation, fragment)
+            for (elem, operation, _), fragment in zip(edits, fragments)
+        ]
 
     def get_next_rid(self):
-        """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        """Get the next available rId for relationships files.
+
+        The file is scanned on the first call, and again after invalidate().
+        Otherwise calls count on from there, including rIds of Relationship
+        elements inserted since through this editor.
+        """
+        if self._max_rid is None:
+            self._max_rid = _max_numeric_id(
+                (
+                    self._attribute(rel_elem, "Id")
+                    for rel_elem in self._elements_by_tag("Relationship")
+                ),
+                prefix="rId",
+                default=0,
+            )
+        return f"rId{self._max_rid + 1}"
+
+    def _note_rids(self, nodes):
+        """Count the rIds of inserted Relationship elements as taken."""
+        if self._max_rid is None:
+            return  # The first get_next_rid call scans the whole file
+        self._max_rid = _max_numeric_id(
+            (
+                self._attribute(elem, "Id")
+                for node in nodes
+                if self._is_element(node)
+                for elem in self._subtree_elements(node)
+                if self.tag_name(elem) == "Relationship"
+            ),
+            prefix="rId",
+            default=self._max_rid,
+        )
 
     def save(self):
         """
@@ -310,17 +696,22 @@ class XMLEditor:
         self.xml_path.write_bytes(content)
 
     def _parse_fragment(self, xml_content):
+        """Parse one XML fragment; see _parse_fragments."""
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, contents):
         """
-        Parse XML fragment and return list of imported nodes.
+        Parse XML fragments in one document and return their imported nodes.
 
         Args:
-            xml_content: String containing XML fragment
+            contents: Strings containing XML fragments
 
         Returns:
-            List of defusedxml.minidom.Node objects imported into this document
+            List with a list of defusedxml.minidom.Node objects imported into
+            this document per fragment
 
         Raises:
-            AssertionError: If fragment contains no element nodes
+            AssertionError: If a fragment contains no element nodes
         """
         # Extract namespace declarations from the root document element
         root_elem = self.dom.documentElement
@@ -332,16 +723,381 @@ class XMLEditor:
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        fragments = "".join(f"<fragment>{content}</fragment>" for content in contents)
+        wrapper = f"<root {ns_decl}>{fragments}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        results = []
+        for fragment in fragment_doc.documentElement.childNodes:  # type: ignore
+            nodes = [
+                self.dom.importNode(child, deep=True) for child in fragment.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            results.append(nodes)
+        return results
+
+    def _place_fragment(self, elem, operation, nodes):
+        """Insert parsed fragment nodes relative to elem; see EDIT_OPERATIONS."""
+        if operation == "append_to":
+            for node in nodes:
+                elem.appendChild(node)
+                self._invalidate(node)
+        else:
+            parent = elem.parentNode
+            # insertBefore appends when the reference is None
+            reference = elem.nextSibling if operation == "insert_after" else elem
+            if operation == "replace_node":
+                self._forget(elem)
+            for node in nodes:
+                parent.insertBefore(node, reference)
+                self._invalidate(node)
+            if operation == "replace_node":
+                parent.removeChild(elem)
+        self._note_rids(nodes)
         return nodes
 
+    def _descendants_by_tag(self, node, tags):
+        """Return {tag: descendant elements named tag} in document order.
+
+        Like getElementsByTagName for each tag, but in a single traversal.
+        """
+        found = {tag: [] for tag in tags}
+        stack = list(reversed(node.childNodes))
+        while stack:
+            child = stack.pop()
+            if child.nodeType == child.ELEMENT_NODE:
+                bucket = found.get(child.tagName)
+                if bucket is not None:
+                    bucket.append(child)
+                stack.extend(reversed(child.childNodes))
+        return found
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by an lxml tree instead of a minidom DOM.
+
+    lxml parses several times faster and its tree takes a fraction of the
+    memory, which matters for large parts such as the document.xml of a long
+    contract. The public API is the same, but nodes are lxml elements: line
+    numbers come from their sourceline, and they are inspected and edited
+    with lxml's API (or tag_name and parent_node) rather than minidom's.
+    Text lives in .text and .tail, so replace_node and the insert methods
+    return the inserted elements and comments but no text nodes.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml ElementTree
+    """
+
+    def _parse(self):
+        # No DTDs, external entities or network access, as with defusedxml
+        parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+        self.tree = lxml.etree.parse(str(self.xml_path), parser)
+        self._clark_names = {}
+        self._root_nsmap = None
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Serializes the tree and writes it back to the original file path,
+        preserving the original encoding (ascii or utf-8).
+        """
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        content = lxml.etree.tostring(
+            self.tree, encoding=self.encoding, xml_declaration=False
+        )
+        self.xml_path.write_bytes(declaration.encode(self.encoding) + content)
+
+    def tag_name(self, elem):
+        tag = elem.tag
+        if tag[0] != "{":
+            return tag
+        local = tag[tag.index("}") + 1 :]
+        prefix = elem.prefix
+        return f"{prefix}:{local}" if prefix else local
+
+    def parent_node(self, elem):
+        return elem.getparent()
+
+    def _declare_namespace(self, prefix, uri):
+        """Declare a namespace prefix on the root element if it is missing.
+
+        lxml cannot add declarations to an existing element. A new prefix is
+        declared in place by cleanup_namespaces, told to keep every prefix
+        declared in the tree: unused declarations still matter in OOXML (e.g.
+        prefixes named in mc:Ignorable). To bind a prefix to another URI, the
+        root is replaced by a copy that declares it; all other elements stay
+        the same objects, but moving them is slow for large trees.
+        """
+        namespaces = self._root_namespaces()
+        if namespaces.get(prefix) == uri:
+            return
+
+        if prefix not in namespaces:
+            declared = {
+                declared_prefix
+                for _, (declared_prefix, _) in lxml.etree.iterwalk(
+                    self.tree, events=("start-ns",)
+                )
+            }
+            declared.add(prefix)
+            lxml.etree.cleanup_namespaces(
+                self.tree,
+                top_nsmap={prefix: uri},
+                keep_ns_prefixes=[name for name in declared if name],
+            )
+            self._clark_names = {}
+            self._root_nsmap = None
+            return
+
+        root = self.tree.getroot()
+        new_root = root.makeelement(
+            root.tag, attrib=dict(root.attrib), nsmap={**root.nsmap, prefix: uri}
+        )
+        new_root.text = root.text
+        new_root.sourceline = root.sourceline
+        before = list(root.itersiblings(preceding=True))
+        after = list(root.itersiblings())
+        new_root.extend(list(root))
+        self.tree._setroot(new_root)
+        # Processing instructions and comments around the root move along
+        for node in reversed(before):
+            new_root.addprevious(node)
+        for node in reversed(after):
+            new_root.addnext(node)
+
+        self._clark_names = {}
+        self._root_nsmap = None
+        self._buckets = None  # The root changed; rebuild on next lookup
+
+    def _place_after(self, elem, text, nodes):
+        """Insert nodes directly after elem, before the text following it."""
+        trailing, elem.tail = elem.tail, None
+        self._insert_nodes(elem.getparent(), elem.getnext(), text, nodes)
+        nodes[-1].tail = _join_text(nodes[-1].tail, trailing)
+
+    def _insert_nodes(self, parent, before, text, nodes):
+        """Insert parsed fragment nodes into parent in front of its child before.
+
+        With before None, the nodes are appended. The fragment's leading text
+        joins the text in front of that position. Nodes are placed next to
+        their neighbours rather than by child index, which lxml would have to
+        count from the first child.
+        """
+        if before is not None:
+            previous = before.getprevious()
+        else:
+            previous = next(parent.iterchildren(reversed=True), None)
+        if text:
+            if previous is None:
+                parent.text = _join_text(parent.text, text)
+            else:
+                previous.tail = _join_text(previous.tail, text)
+        for node in nodes:
+            if previous is None:
+                parent.insert(0, node)
+            else:
+                previous.addnext(node)
+            previous = node
+            self._invalidate(node)
+        self._note_rids(nodes)
+
+    def _parse_fragments(self, contents):
+        """
+        Parse XML fragments in the namespace context of the root element.
+
+        Returns:
+            list: (text before the first node, list of element and comment
+                nodes) per fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        namespaces = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self._root_namespaces().items()
+        )
+        fragments = "".join(f"<fragment>{content}</fragment>" for content in contents)
+        parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+        wrapper = lxml.etree.fromstring(
+            f"<root {namespaces}>{fragments}</root>", parser
+        )
+        # Inserted content has no line in the original file
+        for node in wrapper.iter():
+            node.sourceline = 0
+
+        results = []
+        for fragment in wrapper:
+            nodes = list(fragment)
+            assert any(
+                isinstance(node.tag, str) for node in nodes
+            ), "Fragment must contain at least one element"
+            results.append((fragment.text, nodes))
+        return results
+
+    def _place_fragment(self, elem, operation, fragment):
+        text, nodes = fragment
+        if operation == "append_to":
+            self._insert_nodes(elem, None, text, nodes)
+        elif operation == "insert_after":
+            self._place_after(elem, text, nodes)
+        else:
+            parent = elem.getparent()
+            if operation == "replace_node":
+                self._forget(elem)
+            self._insert_nodes(parent, elem, text, nodes)
+            if operation == "replace_node":
+                # The text that followed elem now follows the inserted nodes
+                nodes[-1].tail = _join_text(nodes[-1].tail, elem.tail)
+                parent.remove(elem)
+        return nodes
+
+    def _clark(self, qname, elem=None, attribute=False):
+        """Resolve a prefixed name to lxml's {uri}local form, or None if unbound.
+
+        Prefixes are looked up on the root element, then in elem's scope.
+        Unprefixed element names are in the default namespace, unprefixed
+        attribute names in no namespace.
+        """
+        key = (qname, attribute)
+        clark = self._clark_names.get(key)
+        if clark is not None:
+            return clark
+
+        prefix, _, local = qname.rpartition(":")
+        if not prefix and attribute:
+            return qname
+        if prefix == "xml":
+            uri = "http://www.w3.org/XML/1998/namespace"
+        else:
+            uri = self._root_namespaces().get(prefix or None)
+            if uri is None and elem is not None:
+                uri = elem.nsmap.get(prefix or None)
+                if uri is None:
+                    return None if prefix else qname
+                return f"{{{uri}}}{local}"
+        if uri is None:
+            return None if prefix else qname
+
+        clark = f"{{{uri}}}{local}"
+        self._clark_names[key] = clark
+        return clark
+
+    def _root_namespaces(self):
+        """Return the root element's prefix -> URI map, computed once per root."""
+        if self._root_nsmap is None:
+            self._root_nsmap = self.tree.getroot().nsmap
+        return self._root_nsmap
+
+    def _descendants(self, node, tag):
+        """Return the descendant elements named tag, like getElementsByTagName."""
+        clark = self._clark(tag)
+        if clark is None:
+            return []
+        return list(node.iterdescendants(clark))
+
+    def _descendants_by_tag(self, node, tags):
+        found = {tag: [] for tag in tags}
+        clarks = {}
+        for tag in tags:
+            clark = self._clark(tag)
+            if clark is not None:
+                clarks[clark] = tag
+        for elem in node.iterdescendants():
+            tag = clarks.get(elem.tag)
+            if tag is not None:
+                found[tag].append(elem)
+        return found
+
+    def _get_element_text(self, elem):
+        return "".join(text for text in elem.itertext() if text.strip())
+
+    def _text_holders(self, elem):
+        if elem.text and elem.text.strip():
+            yield elem, elem.text
+        for child in elem:
+            if isinstance(child.tag, str):
+                yield from self._text_holders(child)
+            # A tail is text of the parent, with offsets counted within the tail
+            if child.tail and child.tail.strip():
+                yield elem, child.tail
+
+    def _root(self):
+        return self.tree.getroot()
+
+    def _elements_by_tag(self, tag):
+        root = self.tree.getroot()
+        clark = self._clark(tag) if tag != "*" else None
+        if clark is None:
+            # Match by name like minidom, e.g. for prefixes declared below the root
+            return [
+                elem
+                for elem in root.iter()
+                if isinstance(elem.tag, str)
+                and (tag == "*" or self.tag_name(elem) == tag)
+            ]
+        return [elem for elem in root.iter(clark) if self.tag_name(elem) == tag]
+
+    def _subtree_elements(self, node):
+        return (elem for elem in node.iter() if isinstance(elem.tag, str))
+
+    def _is_element(self, node):
+        return isinstance(node.tag, str)
+
+    def _line_of(self, elem):
+        return elem.sourceline
+
+    def _attribute(self, elem, name):
+        clark = self._clark(name, elem, attribute=True)
+        return elem.get(clark, "") if clark is not None else ""
+
+    def _is_attached(self, node):
+        root = self.tree.getroot()
+        while node is not None:
+            if node is root:
+                return True
+            node = node.getparent()
+        return False
+
+
+def _join_text(first, second):
+    """Concatenate two lxml text or tail values, either of which may be None."""
+    if not second:
+        return first
+    return (first or "") + second
+
+
+def _max_numeric_id(values, prefix="", default=-1):
+    """Return the highest number among IDs such as "rId7", or default if none.
+
+    Args:
+        values: ID strings; those without prefix or not numeric are skipped
+        prefix: Text in front of the number (e.g. "rId")
+        default: Result if no value is a numbered ID, and the lowest result
+    """
+    max_id = default
+    for value in values:
+        if value.startswith(prefix):
+            try:
+                max_id = max(max_id, int(value[len(prefix) :]))
+            except ValueError:
+                pass
+    return max_id
+
+
+def _iter_elements(node):
+    """Yield an element and all its descendant elements."""
+    stack = [node]
+    while stack:
+        elem = stack.pop()
+        yield elem
+        stack.extend(
+            child for child in elem.childNodes if child.nodeType == child.ELEMENT_NODE
+        )
+
 
 def _create_line_tracking_parser():
     """
@@ -0,0 +1,168 @@
+import copy
+import tempfile
+import unittest
+from pathlib import Path
+
+from .utilities import LxmlXMLEditor, XMLEditor
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NAMESPACE}">
+  <w:body>
+    <w:p w:id="1">
+      <w:r>
+        <w:t>First paragraph</w:t>
+      </w:r>
+    </w:p>
+    <w:p w:id="2">
+      <w:r>
+        <w:t>Second paragraph</w:t>
+      </w:r>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+RELATIONSHIPS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="styles" Target="styles.xml"/>
+</Relationships>
+"""
+
+
+class EditorTests:
+    """Tests run against both editor backends.
+
+    Subclasses make the direct edits in their backend's API: text_node_of,
+    set_attribute, set_text and append_copy.
+    """
+
+    editor_class = None
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+        path = self.root / "document.xml"
+        path.write_text(DOCUMENT)
+        self.editor = self.editor_class(path)
+
+    def open_relationships(self):
+        path = self.root / "document.xml.rels"
+        path.write_text(RELATIONSHIPS)
+        return self.editor_class(path)
+
+    def test_attribute_edit_is_found_after_invalidate(self):
+        para = self.editor.get_node(tag="w:p", attrs={"w:id": "1"})
+
+        self.set_attribute(para, "id", "7")
+        self.editor.invalidate()
+
+        self.assertIs(self.editor.get_node(tag="w:p", attrs={"w:id": "7"}), para)
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:p", attrs={"w:id": "1"})
+
+    def test_text_edit_is_found_after_invalidate(self):
+        para = self.editor.get_node(tag="w:p", contains="First")
+
+        self.set_text(self.text_node_of(para), "Second paragraph, edited")
+        self.editor.invalidate()
+
+        with self.assertRaisesRegex(ValueError, "Multiple nodes found"):
+            self.editor.get_node(tag="w:p", contains="Second")
+        self.assertIs(self.editor.get_node(tag="w:p", contains="edited"), para)
+        self.assertEqual(len(self.editor.find_text("Second paragraph")), 2)
+
+    def test_added_element_is_found_after_invalidate(self):
+        para = self.editor.get_node(tag="w:p", attrs={"w:id": "2"})
+
+        self.append_copy(para)
+        self.editor.invalidate()
+
+        with self.assertRaisesRegex(ValueError, "Multiple nodes found"):
+            self.editor.get_node(tag="w:p", attrs={"w:id": "2"})
+
+    def test_rid_counter_rescans_after_invalidate(self):
+        editor = self.open_relationships()
+        self.assertEqual(editor.get_next_rid(), "rId2")
+
+        rel = editor.get_node(tag="Relationship", attrs={"Id": "rId1"})
+        self.append_copy(rel)
+        self.set_attribute(rel, "Id", "rId5", namespace=None)
+        editor.invalidate()
+
+        self.assertEqual(editor.get_next_rid(), "rId6")
+
+    def test_editor_edits_need_no_invalidate(self):
+        para = self.editor.get_node(tag="w:p", contains="First")
+        self.editor.get_node(tag="w:p", attrs={"w:id": "2"})
+
+        (new_para,) = [
+            node
+            for node in self.editor.insert_after(
+                para, '<w:p w:id="3"><w:r><w:t>Third paragraph</w:t></w:r></w:p>'
+            )
+            if self.editor.tag_name(node) == "w:p"
+        ]
+        self.editor.replace_node(para, "<w:p><w:r><w:t>Replaced</w:t></w:r></w:p>")
+
+        self.assertIs(self.editor.get_node(tag="w:p", attrs={"w:id": "3"}), new_para)
+        self.assertIs(self.editor.get_node(tag="w:p", contains="Third"), new_para)
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:p", contains="First")
+        self.assertEqual(len(self.editor.find_text("paragraph")), 2)
+
+    def test_cached_text_follows_editor_edits(self):
+        first = self.editor.get_node(tag="w:p", contains="First")
+        second = self.editor.get_node(tag="w:p", contains="Second")
+
+        self.editor.append_to(first, "<w:r><w:t>, extended</w:t></w:r>")
+        run = self.editor.get_node(tag="w:r", contains="Second")
+        self.editor.replace_node(run, "<w:r><w:t>Second clause</w:t></w:r>")
+
+        self.assertIs(self.editor.get_node(tag="w:p", contains="extended"), first)
+        self.assertIs(self.editor.get_node(tag="w:p", contains="clause"), second)
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:p", contains="Second paragraph")
+        ((para, segments),) = self.editor.find_text("paragraph, extended")
+        self.assertIs(para, first)
+        self.assertEqual(len(segments), 2)
+
+
+# Run from the docx skill root with: python -m unittest scripts.utilities_test
+class TestMinidomEditor(EditorTests, unittest.TestCase):
+    editor_class = XMLEditor
+
+    def text_node_of(self, para):
+        return para.getElementsByTagName("w:t")[0]
+
+    def set_attribute(self, elem, name, value, namespace=W_NAMESPACE):
+        elem.setAttribute(f"w:{name}" if namespace else name, value)
+
+    def set_text(self, elem, text):
+        elem.firstChild.data = text
+
+    def append_copy(self, elem):
+        elem.parentNode.appendChild(elem.cloneNode(deep=True))
+
+
+class TestLxmlEditor(EditorTests, unittest.TestCase):
+    editor_class = LxmlXMLEditor
+
+    def text_node_of(self, para):
+        return para.find(f".//{{{W_NAMESPACE}}}t")
+
+    def set_attribute(self, elem, name, value, namespace=W_NAMESPACE):
+        elem.attrib[f"{{{namespace}}}{name}" if namespace else name] = value
+
+    def set_text(self, elem, text):
+        elem.text = text
+
+    def append_copy(self, elem):
+        elem.getparent().append(copy.deepcopy(elem))
+
+
+if __name__ == "__main__":
+    unittest.main()